@@ -0,0 +1,59 @@
+"""JSON decode/encode helpers with an optional ``orjson`` fast path.
+
+``orjson`` is not a hard requirement: when it is not installed every helper
+falls back to the stdlib ``json`` module and produces the same output. It is
+only used for encoding; decoding always goes through stdlib ``json``.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def load_json_file(path: str) -> Any:
+    """Read and decode a UTF-8 JSON file in one ``read()``.
+
+    Decoding always uses stdlib ``json``: ``orjson.loads`` silently turns
+    integers outside the 64-bit range into floats, so values such as a large
+    CHECK literal would not round-trip.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return json.loads(raw)
+
+
+def _orjson_safe(obj: Any) -> bool:
+    """True when ``obj`` holds no floats.
+
+    orjson formats floats differently from stdlib ``json`` (``1e16`` vs
+    ``1e+16``, ``1e-05`` vs ``0.00001``) and writes NaN/Infinity as ``null``,
+    so any float sends the whole value through stdlib ``json``.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        cls = value.__class__
+        if cls is dict:
+            stack.extend(value.values())
+        elif cls is list or cls is tuple:
+            stack.extend(value)
+        elif cls is float:
+            return False
+    return True
+
+
+def dumps_json(obj: Any, indent: int = 2) -> str:
+    """Encode ``obj`` like ``json.dumps(obj, indent=indent, ensure_ascii=False)``.
+
+    orjson is used for float-free values at two-space indentation; integers
+    outside its 64-bit range make it raise, and those fall back to stdlib.
+    """
+    if orjson is not None and indent == 2 and _orjson_safe(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
@@ -1,27 +1,69 @@
-"""Schema Adapters - Convert native schema formats to Unified Meta Schema."""
+"""Schema Adapters - Convert native schema formats to Unified Meta Schema.
+
+Adapter classes are imported on first use: a caller that reads one source
+type (``schema_inspector``, ``validation``) only pays for that adapter's
+module and its compiled regex tables.
+"""
+import importlib
+from typing import Iterator, Mapping
+
 from ._base import DatabaseAdapter
-from .postgresql_adapter import PostgreSQLAdapter
-from .mongodb_adapter import MongoDBAdapter
-from .neo4j_adapter import Neo4jAdapter
-from .cassandra_adapter import CassandraAdapter
 
 from config import (
     SOURCE_TYPE_RELATIONAL, SOURCE_TYPE_DOCUMENT,
     SOURCE_TYPE_GRAPH, SOURCE_TYPE_COLUMNAR,
 )
 
+# Adapter class name -> defining submodule.
+_EXPORTS = {
+    'PostgreSQLAdapter': 'Schema.adapters.postgresql_adapter',
+    'MongoDBAdapter': 'Schema.adapters.mongodb_adapter',
+    'Neo4jAdapter': 'Schema.adapters.neo4j_adapter',
+    'CassandraAdapter': 'Schema.adapters.cassandra_adapter',
+}
+
 __all__ = [
     'DatabaseAdapter',
     'PostgreSQLAdapter', 'MongoDBAdapter', 'Neo4jAdapter', 'CassandraAdapter',
     'ADAPTER_REGISTRY',
 ]
 
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+class _AdapterRegistry(Mapping):
+    """Read-only ``{source type: adapter class}`` that imports each adapter
+    module the first time its source type is looked up."""
+
+    def __init__(self, class_names: Mapping):
+        self._class_names = dict(class_names)
+
+    def __getitem__(self, db_type: str) -> type:
+        return __getattr__(self._class_names[db_type])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._class_names)
+
+    def __len__(self) -> int:
+        return len(self._class_names)
+
+    def __repr__(self) -> str:
+        return f"ADAPTER_REGISTRY({self._class_names!r})"
+
+
 # Adapter Registry: Maps database type string to adapter class.
 # Used by run_migration() to dynamically select the correct adapter
 # instead of hardcoded if/else chains.
-ADAPTER_REGISTRY = {
-    SOURCE_TYPE_RELATIONAL: PostgreSQLAdapter,
-    SOURCE_TYPE_DOCUMENT: MongoDBAdapter,
-    SOURCE_TYPE_GRAPH: Neo4jAdapter,
-    SOURCE_TYPE_COLUMNAR: CassandraAdapter,
-}
+ADAPTER_REGISTRY = _AdapterRegistry({
+    SOURCE_TYPE_RELATIONAL: 'PostgreSQLAdapter',
+    SOURCE_TYPE_DOCUMENT: 'MongoDBAdapter',
+    SOURCE_TYPE_GRAPH: 'Neo4jAdapter',
+    SOURCE_TYPE_COLUMNAR: 'CassandraAdapter',
+})
@@ -6,6 +6,18 @@ from typing import List, Optional
 from Schema.unified_meta_schema import Database
 
 
+# SQL comments shared by the PostgreSQL and Cassandra adapters: ``-- ...`` to
+# end of line, or ``/* ... */`` across lines. One alternation, one pass over
+# the DDL; whichever comment opens first wins, so a ``--`` inside a block
+# comment can no longer swallow its closing ``*/``.
+_SQL_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+# Tokens that matter when splitting a CREATE TABLE body into columns: parens,
+# commas, and single-quoted strings ('' escapes a quote) whose contents are
+# skipped so a ')' or ',' inside a literal is not taken as structure. Public:
+# the PostgreSQL adapter scans CREATE TABLE bodies in place with it.
+COLUMN_DELIMITER_RE = re.compile(r"'(?:[^']|'')*'|[(),]")
+
+
 class DatabaseAdapter(ABC):
     """Common interface every database adapter must implement."""
 
@@ -35,33 +47,29 @@ class DatabaseAdapter(ABC):
     @staticmethod
     def _remove_sql_comments(ddl: str) -> str:
         """Strip SQL-style ``--`` line comments and ``/* ... */`` block comments."""
-        # Remove single-line comments (-- ...)
-        ddl = re.sub(r'--.*$', '', ddl, flags=re.MULTILINE)
-        # Remove multi-line comments (/* ... */)
-        ddl = re.sub(r'/\*.*?\*/', '', ddl, flags=re.DOTALL)
-        return ddl
+        return _SQL_COMMENT_RE.sub('', ddl)
 
     @staticmethod
     def _split_columns(body: str) -> List[str]:
         """Split a CREATE TABLE body on top-level commas, ignoring those"""
+        # Jump between delimiter characters only and slice the text between
+        # top-level commas, instead of growing a string one char at a time.
         result = []
-        current = ""
         depth = 0
+        start = 0
 
-        for char in body:
+        for m in COLUMN_DELIMITER_RE.finditer(body):
+            char = m.group()
             if char == '(':
                 depth += 1
-                current += char
             elif char == ')':
                 depth -= 1
-                current += char
             elif char == ',' and depth == 0:
-                result.append(current.strip())
-                current = ""
-            else:
-                current += char
+                result.append(body[start:m.start()].strip())
+                start = m.end()
 
-        if current.strip():
-            result.append(current.strip())
+        tail = body[start:].strip()
+        if tail:
+            result.append(tail)
 
         return result
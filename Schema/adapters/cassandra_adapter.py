@@ -160,7 +160,7 @@ class CassandraAdapter(DatabaseAdapter):
             if attr and attr.name in order_map:
                 up.clustering_order = order_map[attr.name]
 
-    # ``_split_columns`` is inherited from DatabaseAdapter (shared with PostgreSQL).
+    # ``_split_columns`` is inherited from DatabaseAdapter.
 
     def _parse_column(self, col_def: str) -> Tuple[Optional[Property], bool]:
         """Parse a single column definition."""
@@ -1,14 +1,17 @@
 """MongoDB Adapter - Parse MongoDB JSON Schema to Unified Meta Schema."""
+import copy
+import functools
 import json
 import re
-from typing import Dict, Any, Optional, List, Tuple, Union
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
 from ..unified_meta_schema import (
     Database, DatabaseType, EntityType, EntityKind, Property,
     UniqueConstraint, UniqueProperty, PKTypeEnum,
-    Embedded, Reference, Cardinality, PrimitiveDataType, PrimitiveType,
+    Embedded, Reference, Cardinality, DataType, PrimitiveDataType, PrimitiveType,
     ListDataType, SetDataType, MapDataType,
     RelationshipType, TypeMappings
 )
+from .._json_io import dumps_json, load_json_file
 from ._base import DatabaseAdapter
 
 
@@ -40,11 +43,24 @@ _CROSS_COLLECTION_REF_RE = re.compile(
 # treated as the marker; the phrase in the middle of a longer text is ignored.
 _SELF_REFERENCE_RE = re.compile(r"\A\s*Self-reference", re.IGNORECASE)
 
+# Shared ``required`` set for the common case of an object schema that lists no
+# required fields (most leaf sub-documents), so no empty set is built per level.
+_EMPTY_REQUIRED: frozenset = frozenset()
+
+# Target-end cardinality indexed by ``is_required`` (False -> 0, True -> 1):
+# a single tuple load instead of a conditional per embedded property.
+_OBJECT_CARDINALITY = (Cardinality.ZERO_TO_ONE, Cardinality.ONE_TO_ONE)
+_ARRAY_CARDINALITY = (Cardinality.ZERO_TO_MANY, Cardinality.ONE_TO_MANY)
+
 
 class MongoDBAdapter(DatabaseAdapter):
     """Adapter to parse MongoDB JSON Schema and create Unified Meta Schema."""
 
-    # BSON type to PrimitiveType mapping (from centralized TypeMappings)
+    # BSON type to PrimitiveType mapping (from centralized TypeMappings).
+    # The keys are source literals and therefore already interned. Decoded
+    # JSON strings are deliberately not ``sys.intern``-ed before lookup: that
+    # is itself a hash-table probe, costing as much as the equality compare
+    # it would save on this small, closed key set.
     TYPE_MAP = TypeMappings.MONGODB_TO_PRIMITIVE
 
     def __init__(self):
@@ -79,12 +95,37 @@ class MongoDBAdapter(DatabaseAdapter):
         return self.database
 
     def _parse_object_schema(self, schema: Dict[str, Any], name: str, parent_path: List[str] = None, is_root: bool = False) -> EntityType:
-        """Parse an object schema into EntityType."""
-        if parent_path is None:
-            parent_path = []
+        """Parse an object schema and its embedded sub-documents into EntityTypes."""
+        # Explicit-stack depth-first walk instead of recursion: deeply nested
+        # documents no longer pay a Python frame per level. Each stack slot
+        # holds an entity and the iterator over its pending child schemas.
+        # Children are registered in post-order (a sub-document after its own
+        # sub-documents), matching the order the recursive form produced; the
+        # top-level entity is returned unregistered, as before.
+        entity, children = self._parse_object_level(schema, name, parent_path or [], is_root)
+        add_entity_type = self.database.add_entity_type
+        stack = [(entity, iter(children))]
+        while stack:
+            current, pending = stack[-1]
+            child = next(pending, None)
+            if child is None:
+                stack.pop()
+                if stack:
+                    add_entity_type(current)
+                continue
+            child_schema, child_name = child
+            child_entity, grandchildren = self._parse_object_level(
+                child_schema, child_name, current.object_name, False)
+            stack.append((child_entity, iter(grandchildren)))
+        return entity
+
+    def _parse_object_level(self, schema: Dict[str, Any], name: str, parent_path: List[str],
+                            is_root: bool) -> Tuple[EntityType, List[Tuple[Dict[str, Any], str]]]:
+        """Parse one object level; return the entity and its ``(schema, name)`` children."""
         # Build full object_name path (from AC)
         # Example: parent_path=["customers"], name="address" -> ["customers", "address"]
         object_name = parent_path + [name]
+        full_path = ".".join(object_name)
         entity = EntityType(
             object_name=object_name,
             entity_kind=EntityKind.DOCUMENT if is_root else EntityKind.EMBEDDED,
@@ -93,32 +134,52 @@ class MongoDBAdapter(DatabaseAdapter):
             # embedded sub-document without re-deriving it from entity_kind.
             is_root=is_root,
         )
+        children: List[Tuple[Dict[str, Any], str]] = []
 
         properties = schema.get('properties', {})
-        required = set(schema.get('required', []))
+        required = schema.get('required')
+        required = frozenset(required) if required else _EMPTY_REQUIRED
+
+        # Bind the per-property hot names once; the loop below runs for every
+        # property of every (nested) document, so repeated attribute/global
+        # lookups add up on wide schemas.
+        type_map = self.TYPE_MAP
+        _Property = Property
+        _PrimitiveDataType = PrimitiveDataType
+        _ListDataType = ListDataType
+        _Embedded = Embedded
+        _STRING = PrimitiveType.STRING
+        add_property = entity.add_property
+        add_relationship = entity.add_relationship
+        add_child = children.append
 
         for prop_name, prop_schema in properties.items():
-            prop_name_lower = prop_name.lower()
+            # snake_case names are already lowercase; ``islower`` avoids
+            # allocating an identical copy for them.
+            prop_name_lower = prop_name if prop_name.islower() else prop_name.lower()
             is_required = prop_name in required
 
-            # Handle different property types
-            bson_type = prop_schema.get('bsonType') or prop_schema.get('type', 'string')
+            # Handle different property types. ``bsonType`` is present on
+            # almost every Mongo property, so the ``type`` lookup only runs
+            # when it is missing (or empty, as before).
+            bson_type = prop_schema.get('bsonType')
+            if not bson_type:
+                bson_type = prop_schema.get('type', 'string')
 
             if bson_type == 'object':
-                # Embedded object - pass current entity's object_name as parent_path
+                # Embedded object - queued as a child of the current entity
                 # Example: { "address": { "bsonType": "object", "properties": {...} } }
                 #   -> Creates EntityType(object_name=["customers", "address"])
                 #   -> Creates Embedded relationship with Cardinality.ONE_TO_ONE
-                embedded_entity = self._parse_object_schema(prop_schema, prop_name_lower, parent_path=object_name)
-                self.database.add_entity_type(embedded_entity)
+                add_child((prop_schema, prop_name_lower))
 
-                embedded = Embedded(
+                embedded = _Embedded(
                     aggr_name=prop_name_lower,
-                    aggregates=embedded_entity.full_path,  # Use full path for reference
-                    target_end_cardinality=Cardinality.ONE_TO_ONE if is_required else Cardinality.ZERO_TO_ONE,
+                    aggregates=f"{full_path}.{prop_name_lower}",  # Child's full path
+                    target_end_cardinality=_OBJECT_CARDINALITY[is_required],
                     is_optional=not is_required
                 )
-                entity.add_relationship(embedded)
+                add_relationship(embedded)
 
             elif bson_type == 'array':
                 # Array - check if array of objects or primitives
@@ -127,46 +188,53 @@ class MongoDBAdapter(DatabaseAdapter):
                 # Example 2 (primitive array): { "tags": ["tag1", "tag2"] }
                 #   -> Creates Property with ListDataType
                 items = prop_schema.get('items', {})
-                items_type = items.get('bsonType') or items.get('type', 'string')
+                items_type = items.get('bsonType')
+                if not items_type:
+                    items_type = items.get('type', 'string')
 
                 if items_type == 'object':
-                    # Array of embedded objects - pass current entity's object_name as parent_path
+                    # Array of embedded objects - queued as a child of the current entity
                     # Example: { "items": { "bsonType": "array", "items": { "bsonType": "object" } } }
                     #   -> Creates EntityType for the embedded object
                     #   -> Creates Embedded with Cardinality.ONE_TO_MANY (or ZERO_TO_MANY)
-                    embedded_entity = self._parse_object_schema(items, prop_name_lower, parent_path=object_name)
-                    self.database.add_entity_type(embedded_entity)
+                    add_child((items, prop_name_lower))
 
-                    embedded = Embedded(
+                    embedded = _Embedded(
                         aggr_name=prop_name_lower,
-                        aggregates=embedded_entity.full_path,  # Use full path for reference
-                        target_end_cardinality=Cardinality.ONE_TO_MANY if is_required else Cardinality.ZERO_TO_MANY,
+                        aggregates=f"{full_path}.{prop_name_lower}",  # Child's full path
+                        target_end_cardinality=_ARRAY_CARDINALITY[is_required],
                         is_optional=not is_required
                     )
-                    entity.add_relationship(embedded)
+                    add_relationship(embedded)
                 else:
                     # Array of primitives - use ListDataType to preserve array semantics
                     # Example: { "tags": { "bsonType": "array", "items": { "bsonType": "string" } } }
                     #   -> Property("tags", ListDataType(element_type=PrimitiveDataType(STRING)))
-                    element_type = self._parse_primitive_type(items_type, items)
-                    attr = Property(
+                    element_type = _PrimitiveDataType(
+                        primitive_type=type_map.get(items_type, _STRING),
+                        max_length=items.get('maxLength'),
+                    )
+                    attr = _Property(
                         name=prop_name_lower,
-                        data_type=ListDataType(element_type=element_type),
+                        data_type=_ListDataType(element_type=element_type),
                         is_key=False,
                         is_optional=not is_required
                     )
-                    entity.add_property(attr)
+                    add_property(attr)
 
             else:
                 # Primitive type
                 is_key = prop_name == '_id'
-                attr = Property(
+                attr = _Property(
                     name=prop_name_lower,
-                    data_type=self._parse_primitive_type(bson_type, prop_schema),
+                    data_type=_PrimitiveDataType(
+                        primitive_type=type_map.get(bson_type, _STRING),
+                        max_length=prop_schema.get('maxLength'),
+                    ),
                     is_key=is_key,
                     is_optional=not is_required and not is_key
                 )
-                entity.add_property(attr)
+                add_property(attr)
 
                 # Add primary key if _id
                 if is_key:
@@ -188,23 +256,26 @@ class MongoDBAdapter(DatabaseAdapter):
                 #     entity, not at a multi-row collection)
                 #   * target != owner -> cross-collection reference
                 #     (target_end_cardinality follows Mongo's array/non-array convention)
-                if not is_key:
+                # Only properties carrying the structured marker or a
+                # description can be references; plain scalars (the vast
+                # majority) skip the extraction call and its regex searches.
+                if not is_key and (_SMILE_LOGICAL_REF_KEY in prop_schema
+                                   or prop_schema.get('description')):
                     target_table, _target_column = \
                         self._extract_logical_ref_target(
                             prop_schema, owner_entity=entity)
                     if target_table:
-                        is_self_ref = (target_table == entity.full_path)
+                        is_self_ref = (target_table == full_path)
                         # Multiplicity at the target end: per source document,
                         # how many target documents are referenced by this scalar
                         # field. A scalar reference is always 1..1 (NOT NULL) or 0..1.
-                        target_end_cardinality = Cardinality.ONE_TO_ONE \
-                            if is_required else Cardinality.ZERO_TO_ONE
+                        target_end_cardinality = _OBJECT_CARDINALITY[is_required]
                         # Multiplicity at the source end: cross-collection
                         # references default to ZERO_TO_MANY (many docs may carry
                         # the same FK value); self-refs are typically 0..n as well
                         # (an employee can have many direct reports).
                         source_end_cardinality = Cardinality.ZERO_TO_MANY
-                        entity.add_relationship(Reference(
+                        add_relationship(Reference(
                             ref_name=prop_name_lower,
                             refs_to=target_table,
                             target_end_cardinality=target_end_cardinality,
@@ -214,7 +285,7 @@ class MongoDBAdapter(DatabaseAdapter):
                             description=prop_schema.get('description') or None,
                         ))
 
-        return entity
+        return entity, children
 
     @staticmethod
     def _extract_logical_ref_target(prop_schema: Dict[str, Any],
@@ -238,23 +309,10 @@ class MongoDBAdapter(DatabaseAdapter):
 
         return None, None
 
-    def _parse_primitive_type(self, bson_type: str, schema: Dict[str, Any]) -> PrimitiveDataType:
-        """Parse BSON type to PrimitiveDataType."""
-        primitive = self.TYPE_MAP.get(bson_type, PrimitiveType.STRING)
-
-        max_length = schema.get('maxLength')
-        # MongoDB doesn't have precision/scale in JSON Schema, but we can infer from description
-
-        return PrimitiveDataType(
-            primitive_type=primitive,
-            max_length=max_length
-        )
-
     @staticmethod
     def load_from_file(file_path: str, db_name: str = None) -> Database:
         """Load MongoDB JSON Schema from file and parse to Database."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        schema = load_json_file(file_path)
 
         if db_name is None:
             db_name = schema.get('title', 'mongodb_schema')
@@ -275,16 +333,22 @@ class MongoDBAdapter(DatabaseAdapter):
         if not database.entity_types:
             return {"bsonType": "object", "properties": {}}
 
+        # Embedded-subtree cache shared by every collection rendered in this
+        # call, so an entity reachable from several parents is exported once.
+        cache: Dict[str, Dict[str, Any]] = {}
+
         # Caller pinned a specific root → single-root export, no auto-detect.
         if root_entity_name is not None:
-            return cls._build_single_collection_schema(database, root_entity_name, is_top_level=True)
+            return cls._build_single_collection_schema(
+                database, root_entity_name, is_top_level=True, cache=cache)
 
         roots = cls._find_root_entities(database)
         if len(roots) <= 1:
             # Zero/one root: keep the legacy flat shape so existing single-root
             # consumers (and the round-trip validator) see no behavior change.
             chosen = roots[0] if roots else next(iter(database.entity_types.keys()), None)
-            return cls._build_single_collection_schema(database, chosen, is_top_level=True)
+            return cls._build_single_collection_schema(
+                database, chosen, is_top_level=True, cache=cache)
 
         # Multi-root: emit ``collections`` envelope. Each entry is itself a
         # full collection schema, but with the document-level ``$schema`` /
@@ -296,13 +360,15 @@ class MongoDBAdapter(DatabaseAdapter):
         }
         for root_name in roots:
             envelope["collections"][root_name] = cls._build_single_collection_schema(
-                database, root_name, is_top_level=False
+                database, root_name, is_top_level=False, cache=cache
             )
         return envelope
 
     @classmethod
     def _build_single_collection_schema(cls, database: Database, root_name: str,
-                                        *, is_top_level: bool) -> Dict[str, Any]:
+                                        *, is_top_level: bool,
+                                        cache: Optional[Dict[str, Dict[str, Any]]] = None
+                                        ) -> Dict[str, Any]:
         """Render one collection (root + its embedded subtree) as a JSON Schema dict."""
         root_entity = database.get_entity_type(root_name) if root_name else None
         if not root_entity:
@@ -312,7 +378,7 @@ class MongoDBAdapter(DatabaseAdapter):
         # in a multi-root schema still owns the ``_id`` primary-key convention
         # and the same document-level metadata. The envelope-vs-flat decision
         # is just about WHERE that metadata lives, not whether to compute it.
-        schema = cls._export_entity_to_schema(database, root_entity, is_root=True)
+        schema = cls._export_entity_to_schema(database, root_entity, is_root=True, cache=cache)
 
         # Strip the document-level keys when this collection is being placed
         # inside a multi-root envelope — the envelope owns them.
@@ -340,23 +406,21 @@ class MongoDBAdapter(DatabaseAdapter):
     @classmethod
     def _find_root_entities(cls, database: Database) -> List[str]:
         """Return all root collection names, in declaration order."""
-        from ..unified_meta_schema import Embedded, EntityKind
-
+        # Single pass over entities: collect embedded targets and root
+        # candidates together, then drop the targets from the candidates.
+        # ``__class__ is`` skips the MRO walk of ``isinstance`` (Embedded has
+        # no subclasses).
         embedded_targets = set()
-        for entity in database.entity_types.values():
-            for rel in entity.relationships:
-                if isinstance(rel, Embedded):
-                    embedded_targets.add(rel.get_target_entity_name())
-
-        roots: List[str] = []
+        candidates: List[str] = []
         for name, entity in database.entity_types.items():
+            for rel in entity.relationships:
+                if rel.__class__ is Embedded:
+                    embedded_targets.add(rel.aggregates)
             # EDGE entities are graph-paradigm artifacts — never a Mongo root.
-            if entity.entity_kind == EntityKind.EDGE:
-                continue
-            if name in embedded_targets:
-                continue
-            roots.append(name)
-        return roots
+            if entity.entity_kind != EntityKind.EDGE:
+                candidates.append(name)
+
+        return [name for name in candidates if name not in embedded_targets]
 
     @classmethod
     def _find_root_entity(cls, database: Database) -> str:
@@ -367,31 +431,114 @@ class MongoDBAdapter(DatabaseAdapter):
         return next(iter(database.entity_types.keys()), None)
 
     @classmethod
-    def _export_entity_to_schema(cls, database: Database, entity: EntityType, is_root: bool = False) -> Dict[str, Any]:
-        """Export a single entity to MongoDB JSON Schema format."""
-        from ..unified_meta_schema import Embedded, Cardinality
-
-        schema = {
-            "bsonType": "object",
-            "required": [],
-            "properties": {}
-        }
+    def _export_entity_to_schema(cls, database: Database, entity: EntityType, is_root: bool = False,
+                                 cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Export an entity and its embedded subtree to MongoDB JSON Schema format.
+
+        ``cache`` maps ``full_path`` to the exported schema of an embedded
+        (non-root) entity. Root schemas are never cached: each root call
+        builds a new dict that the caller may mutate freely. A non-root
+        request is answered with a copy of the cached subtree.
+        """
+        if cache is None:
+            cache = {}
+        if not is_root and entity.full_path in cache:
+            return copy.deepcopy(cache[entity.full_path])
+
+        # Iterative post-order walk over Embedded edges, so every sub-document
+        # schema exists before its parent is assembled and deep nesting costs
+        # no Python frames. Subtrees already in ``cache`` are not revisited.
+        # A node is marked when it is expanded, not when it is pushed: a
+        # child shared with an ancestor may be queued twice, and the copy
+        # popped first is expanded (and so built) before the parent that
+        # reached it. ``on_stack`` holds the ``full_path`` of every node still
+        # being expanded, in order, i.e. the chain of ancestors; a child found
+        # there is an embedding cycle.
+        order: List[Tuple[EntityType, bool]] = []
+        done = set()
+        on_stack: Dict[str, None] = {}
+        stack: List[Tuple[EntityType, bool, bool]] = [(entity, is_root, False)]
+        while stack:
+            current, current_is_root, expanded = stack.pop()
+            key = (current.full_path, current_is_root)
+            if expanded:
+                del on_stack[current.full_path]
+                done.add(key)
+                order.append((current, current_is_root))
+                continue
+            if key in done:
+                continue
+            on_stack[current.full_path] = None
+            stack.append((current, current_is_root, True))
+            for rel in reversed(current.relationships):
+                if rel.__class__ is not Embedded:
+                    continue
+                child = database.get_entity_type(rel.aggregates)
+                if child is None:
+                    continue
+                if child.full_path in on_stack:
+                    chain = list(on_stack)
+                    chain = chain[chain.index(child.full_path):] + [child.full_path]
+                    raise ValueError(f"Embedding cycle: {' -> '.join(chain)}")
+                if (child.full_path, False) in done or child.full_path in cache:
+                    continue
+                stack.append((child, False, False))
+
+        # A subtree built in this call is embedded as the cached object itself
+        # the first time it is used; any further use (or one built by an
+        # earlier call) gets a copy, so no two parents share a nested dict.
+        # Cached subtrees are never mutated after they are built; only the
+        # root dict returned below is, and it is not cached.
+        fresh = set()
+
+        def claim(child: EntityType) -> Dict[str, Any]:
+            child_schema = cache[child.full_path]
+            if child.full_path in fresh:
+                fresh.discard(child.full_path)
+                return child_schema
+            return copy.deepcopy(child_schema)
+
+        schema = None
+        for current, current_is_root in order:
+            schema = cls._export_entity_flat(database, current, current_is_root, claim)
+            if not current_is_root:
+                cache[current.full_path] = schema
+                fresh.add(current.full_path)
+        # Post-order: the requested entity is built last.
+        if not is_root:
+            return copy.deepcopy(schema)
+        return schema
 
-        if is_root:
-            schema["$schema"] = "http://json-schema.org/draft-07/schema#"
-            schema["title"] = entity.name.replace('_', ' ')
-            schema["description"] = f"MongoDB document schema for {entity.name}"
+    @classmethod
+    def _export_entity_flat(cls, database: Database, entity: EntityType, is_root: bool,
+                            claim: Callable[[EntityType], Dict[str, Any]]) -> Dict[str, Any]:
+        """Export one entity; embedded sub-document schemas come from ``claim``."""
+        # Empty sub-document (e.g. a placeholder left behind by a reshape):
+        # nothing to scan or collect.
+        if not is_root and not entity.properties and not entity.relationships:
+            return {"bsonType": "object", "properties": {}}
+
+        # ``properties`` / ``required`` are filled first and the schema dict
+        # is assembled once at the end, so no empty ``required`` list is
+        # inserted and then deleted again.
+        properties: Dict[str, Any] = {}
+        required: List[str] = []
 
         # Build a lookup from property name -> matching logical Reference,
         # used to write the cross-collection reference description back into
         # the JSON Schema. The description is the round-trip signal for the
         # parse-end recognition; without it the meta-model relationship is
-        # invisible in the exported document.
-        logical_ref_by_prop = {
-            rel.ref_name: rel
-            for rel in entity.relationships
-            if isinstance(rel, Reference) and rel.is_enforced is False
-        }
+        # invisible in the exported document. The same single scan over
+        # ``entity.relationships`` also collects the Embedded edges processed
+        # after the properties.
+        logical_ref_by_prop: Dict[str, Reference] = {}
+        embedded_rels: List[Embedded] = []
+        for rel in entity.relationships:
+            rel_class = rel.__class__
+            if rel_class is Embedded:
+                embedded_rels.append(rel)
+            elif rel_class is Reference and rel.is_enforced is False:
+                logical_ref_by_prop[rel.ref_name] = rel
 
         # Process properties
         for attr in entity.properties:
@@ -422,102 +569,121 @@ class MongoDBAdapter(DatabaseAdapter):
                         prop_schema["description"] = (
                             f"Cross-collection reference to {ref.refs_to}._id"
                         )
-            schema["properties"][prop_name] = prop_schema
+            properties[prop_name] = prop_schema
 
             if not attr.is_optional:
-                schema["required"].append(prop_name)
+                required.append(prop_name)
 
         # Process embedded relationships
-        for rel in entity.relationships:
-            if isinstance(rel, Embedded):
-                embedded_entity = database.get_entity_type(rel.get_target_entity_name())
-                if not embedded_entity:
-                    continue
+        for rel in embedded_rels:
+            # ``aggregates`` is what Embedded.get_target_entity_name() returns;
+            # read it directly, as _find_root_entities does.
+            embedded_entity = database.get_entity_type(rel.aggregates)
+            if not embedded_entity:
+                continue
 
-                embedded_schema = cls._export_entity_to_schema(database, embedded_entity, is_root=False)
+            embedded_schema = claim(embedded_entity)
 
-                # Check if it's an array (ONE_TO_MANY, ZERO_TO_MANY)
-                if rel.target_end_cardinality in (Cardinality.ONE_TO_MANY, Cardinality.ZERO_TO_MANY):
-                    schema["properties"][rel.aggr_name] = {
-                        "bsonType": "array",
-                        "description": f"{rel.aggr_name} array",
-                        "items": embedded_schema
-                    }
-                else:
-                    schema["properties"][rel.aggr_name] = embedded_schema
+            # Check if it's an array (ONE_TO_MANY, ZERO_TO_MANY)
+            if rel.target_end_cardinality in (Cardinality.ONE_TO_MANY, Cardinality.ZERO_TO_MANY):
+                properties[rel.aggr_name] = {
+                    "bsonType": "array",
+                    "description": f"{rel.aggr_name} array",
+                    "items": embedded_schema
+                }
+            else:
+                properties[rel.aggr_name] = embedded_schema
 
-                if rel.target_end_cardinality.is_required():
-                    schema["required"].append(rel.aggr_name)
+            if rel.target_end_cardinality.is_required():
+                required.append(rel.aggr_name)
 
-        # Clean up empty required list
-        if not schema["required"]:
-            del schema["required"]
+        # Key order matches the historical output: bsonType, required (only
+        # when non-empty), properties, then the document-level metadata.
+        if required:
+            schema = {"bsonType": "object", "required": required, "properties": properties}
+        else:
+            schema = {"bsonType": "object", "properties": properties}
+
+        if is_root:
+            schema["$schema"] = "http://json-schema.org/draft-07/schema#"
+            schema["title"] = entity.name.replace('_', ' ')
+            schema["description"] = f"MongoDB document schema for {entity.name}"
 
         return schema
 
+    # DataType class -> exporter method name. Keyed on the exact class so each
+    # property costs one dict lookup instead of an ``isinstance`` chain; names
+    # (not functions) keep the table valid for subclasses that override one.
+    _BSON_TYPE_EXPORTERS: Dict[type, str] = {
+        PrimitiveDataType: '_export_primitive_to_bson_type',
+        ListDataType: '_export_list_to_bson_type',
+        SetDataType: '_export_set_to_bson_type',
+        MapDataType: '_export_map_to_bson_type',
+    }
+
     @classmethod
     def _export_property_to_bson_type(cls, attr: Property) -> Dict[str, Any]:
         """Export a property to MongoDB BSON type schema."""
         data_type = attr.data_type
+        exporter = cls._BSON_TYPE_EXPORTERS.get(data_type.__class__)
+        if exporter is None:
+            # Default fallback
+            return {"bsonType": "string"}
+        return getattr(cls, exporter)(data_type)
 
-        # Handle ListDataType (arrays)
-        # Example: ListDataType(STRING) -> {"bsonType": "array", "items": {"bsonType": "string"}}
-        if isinstance(data_type, ListDataType):
-            element_type = data_type.element_type
-            if isinstance(element_type, PrimitiveDataType):
-                element_bson_type = cls.REVERSE_TYPE_MAP.get(element_type.primitive_type, 'string')
-                return {
-                    "bsonType": "array",
-                    "items": {"bsonType": element_bson_type}
-                }
-            else:
-                return {
-                    "bsonType": "array",
-                    "items": {"bsonType": "string"}
-                }
+    @classmethod
+    def _element_bson_type(cls, element_type: DataType) -> str:
+        """BSON type of a collection element; non-primitive elements become strings."""
+        if element_type.__class__ is PrimitiveDataType:
+            return cls.REVERSE_TYPE_MAP.get(element_type.primitive_type, 'string')
+        return 'string'
 
-        # Handle SetDataType (unique arrays)
-        # Example: SetDataType(STRING) -> {"bsonType": "array", "uniqueItems": true}
-        if isinstance(data_type, SetDataType):
-            element_type = data_type.element_type
-            if isinstance(element_type, PrimitiveDataType):
-                element_bson_type = cls.REVERSE_TYPE_MAP.get(element_type.primitive_type, 'string')
-                return {
-                    "bsonType": "array",
-                    "uniqueItems": True,
-                    "items": {"bsonType": element_bson_type}
-                }
-            else:
-                return {
-                    "bsonType": "array",
-                    "uniqueItems": True,
-                    "items": {"bsonType": "string"}
-                }
+    @classmethod
+    def _export_list_to_bson_type(cls, data_type: ListDataType) -> Dict[str, Any]:
+        """ListDataType(STRING) -> {"bsonType": "array", "items": {"bsonType": "string"}}"""
+        return {
+            "bsonType": "array",
+            "items": {"bsonType": cls._element_bson_type(data_type.element_type)}
+        }
 
-        # Handle MapDataType (key-value objects)
-        # Example: MapDataType(STRING, INTEGER) -> {"bsonType": "object"}
-        if isinstance(data_type, MapDataType):
-            return {"bsonType": "object"}
+    @classmethod
+    def _export_set_to_bson_type(cls, data_type: SetDataType) -> Dict[str, Any]:
+        """SetDataType(STRING) -> {"bsonType": "array", "uniqueItems": true, ...}"""
+        return {
+            "bsonType": "array",
+            "uniqueItems": True,
+            "items": {"bsonType": cls._element_bson_type(data_type.element_type)}
+        }
 
-        # Handle PrimitiveDataType
-        if isinstance(data_type, PrimitiveDataType):
-            bson_type = cls.REVERSE_TYPE_MAP.get(data_type.primitive_type, 'string')
-            prop = {"bsonType": bson_type}
+    @classmethod
+    def _export_map_to_bson_type(cls, data_type: MapDataType) -> Dict[str, Any]:
+        """MapDataType(STRING, INTEGER) -> {"bsonType": "object"}"""
+        return {"bsonType": "object"}
 
-            # Add maxLength for strings
-            if data_type.max_length and bson_type == 'string':
-                prop["maxLength"] = data_type.max_length
+    @classmethod
+    def _export_primitive_to_bson_type(cls, data_type: PrimitiveDataType) -> Dict[str, Any]:
+        """PrimitiveDataType -> {"bsonType": ...}, plus maxLength for strings."""
+        # Wide schemas repeat a handful of shapes (e.g. dozens of string(15)
+        # fields); each shape is resolved once and copied into a fresh dict.
+        return dict(cls._primitive_bson_items(data_type.primitive_type, data_type.max_length))
 
-            return prop
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _primitive_bson_items(cls, primitive_type: PrimitiveType,
+                              max_length: Optional[int]) -> Tuple[Tuple[str, Any], ...]:
+        """Key/value pairs of the BSON schema for one primitive shape."""
+        bson_type = cls.REVERSE_TYPE_MAP.get(primitive_type, 'string')
 
-        # Default fallback
-        return {"bsonType": "string"}
+        # Add maxLength for strings
+        if max_length and bson_type == 'string':
+            return (("bsonType", bson_type), ("maxLength", max_length))
+        return (("bsonType", bson_type),)
 
     @classmethod
     def export_to_json_string(cls, database: Database, root_entity_name: str = None, indent: int = 2) -> str:
         """Export to formatted JSON string."""
         schema = cls.export_to_json(database, root_entity_name)
-        return json.dumps(schema, indent=indent, ensure_ascii=False)
+        return dumps_json(schema, indent=indent)
 
     @classmethod
     def export(cls, database: Database) -> str:
@@ -1,6 +1,6 @@
 """PostgreSQL Adapter - Parse SQL DDL to Unified Meta Schema."""
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from ..unified_meta_schema import (
     Database, DatabaseType, EntityType, EntityKind, Property,
     UniqueConstraint, ForeignKeyConstraint, UniqueProperty, ForeignKeyProperty, PKTypeEnum,
@@ -11,7 +11,35 @@ from ..unified_meta_schema import (
     ListDataType, SetDataType, MapDataType,
     RelationshipType, TypeMappings
 )
-from ._base import DatabaseAdapter
+from ._base import DatabaseAdapter, COLUMN_DELIMITER_RE
+
+
+# DDL patterns, compiled once at import. Every table, column and table-level
+# constraint of a parsed DDL goes through at least one of these, so keeping
+# them out of ``re``'s per-call pattern cache lookup matters on large schemas.
+# Header up to and including the body's opening paren; the body itself is
+# delimited by ``_iter_create_tables`` rather than a ``(.*?)\);`` backtrack.
+_CREATE_TABLE_HEAD_RE = re.compile(
+    r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\(',
+    re.IGNORECASE,
+)
+_NAMED_CONSTRAINT_RE = re.compile(r'^CONSTRAINT\s+\w+\s+(.*)$', re.IGNORECASE | re.DOTALL)
+_TABLE_PK_RE = re.compile(r'PRIMARY\s+KEY\s*\(([^)]+)\)', re.IGNORECASE)
+_TABLE_FK_RE = re.compile(
+    r'FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+(?:\w+\.)?(\w+)\s*\(([^)]+)\)',
+    re.IGNORECASE,
+)
+_TABLE_UNIQUE_RE = re.compile(r'UNIQUE\s*\(([^)]+)\)', re.IGNORECASE)
+_TABLE_CHECK_RE = re.compile(r'CHECK\s*\((.*)\)\s*$', re.IGNORECASE | re.DOTALL)
+# column_name TYPE [(params)] [constraints]
+# Handles: "id SERIAL", "name VARCHAR(100)", "price DOUBLE PRECISION"
+_COLUMN_RE = re.compile(r'^(\w+)\s+(\w+(?:\s+PRECISION)?)\s*(?:\(([^)]+)\))?\s*(.*)?$', re.IGNORECASE)
+_REFERENCES_RE = re.compile(r'REFERENCES\s+(\w+)\s*\((\w+)\)', re.IGNORECASE)
+_INLINE_CHECK_RE = re.compile(r'CHECK\s*\(', re.IGNORECASE)
+
+# Leading keywords (on the uppercased definition) that mark a CREATE TABLE
+# body entry as a table-level constraint rather than a column.
+_TABLE_CONSTRAINT_PREFIXES = ('PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE', 'CHECK', 'CONSTRAINT')
 
 
 class _CheckParseError(Exception):
@@ -217,12 +245,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Step 1: Remove comments (helper inherited from DatabaseAdapter)
         ddl = self._remove_sql_comments(ddl_content)
 
-        # Step 2: Extract CREATE TABLE statements
-        tables = self._extract_create_tables(ddl)
-
-        # Step 3: Parse each table
-        for table_name, table_body in tables:
-            entity = self._parse_table(table_name, table_body)
+        # Steps 2+3: Extract CREATE TABLE statements, already split into
+        # column definitions, and parse each table
+        for table_name, columns in self._iter_create_tables(ddl):
+            entity = self._parse_table(table_name, columns)
             self.database.add_entity_type(entity)
 
         # Step 4: Resolve references after all entities are created
@@ -231,21 +257,53 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         return self.database
 
-    def _extract_create_tables(self, ddl: str) -> List[Tuple[str, str]]:
-        """Extract CREATE TABLE statements from DDL."""
-        pattern = r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:\w+\.)?(\w+)\s*\((.*?)\);'
-        matches = re.findall(pattern, ddl, re.IGNORECASE | re.DOTALL)
-        return matches
+    @staticmethod
+    def _iter_create_tables(ddl: str) -> Iterator[Tuple[str, List[str]]]:
+        """Yield ``(table_name, column_defs)`` for each CREATE TABLE statement.
 
-    def _parse_table(self, table_name: str, table_body: str) -> EntityType:
-        """Parse a single CREATE TABLE body into EntityType."""
-        entity = EntityType(object_name=[table_name.lower()], entity_kind=EntityKind.TABLE)
+        One forward scan per body both finds the paren that closes it and
+        splits it on top-level commas (same rules as ``_split_columns``), so
+        the body is never sliced out and re-scanned.
+        """
+        pos = 0
+        while True:
+            m = _CREATE_TABLE_HEAD_RE.search(ddl, pos)
+            if not m:
+                return
+            body_start = m.end()
+            columns: List[str] = []
+            depth = 1
+            start = body_start
+            for tok in COLUMN_DELIMITER_RE.finditer(ddl, body_start):
+                char = tok.group()
+                if char == '(':
+                    depth += 1
+                elif char == ')':
+                    depth -= 1
+                    if depth == 0:
+                        tail = ddl[start:tok.start()].strip()
+                        if tail:
+                            columns.append(tail)
+                        yield m.group(1), columns
+                        pos = tok.end()
+                        break
+                elif char == ',' and depth == 1:
+                    columns.append(ddl[start:tok.start()].strip())
+                    start = tok.end()
+            else:
+                # Unbalanced body: skip this header, keep scanning.
+                pos = body_start
 
-        # Split by comma, but handle parentheses in type definitions
-        # e.g., DECIMAL(15,2) should not be split
-        columns = self._split_columns(table_body)
+    def _parse_table(self, table_name: str, columns: List[str]) -> EntityType:
+        """Parse a single CREATE TABLE body, pre-split into column definitions
+        (commas inside e.g. ``DECIMAL(15,2)`` already kept), into EntityType."""
+        entity = EntityType(object_name=[table_name.lower()], entity_kind=EntityKind.TABLE)
 
         table_level_constraints = []
+        # Columns and their REFERENCES are gathered per table and handed over
+        # in one call each once the column loop is done.
+        new_props: List[Property] = []
+        new_refs: List[Tuple[str, str, str]] = []
 
         for col_def in columns:
             col_def = col_def.strip()
@@ -254,18 +312,18 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
             # Collect table-level constraint definitions for later processing
             upper = col_def.upper()
-            if any(upper.startswith(kw) for kw in ['PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE', 'CHECK', 'CONSTRAINT']):
+            if upper.startswith(_TABLE_CONSTRAINT_PREFIXES):
                 table_level_constraints.append(col_def)
                 continue
 
             # Parse column definition
             attr, ref_info, check_ast = self._parse_column(col_def)
             if attr:
-                entity.add_property(attr)
+                new_props.append(attr)
 
                 # Handle inline PRIMARY KEY constraint
                 # e.g., "id SERIAL PRIMARY KEY"
-                if 'PRIMARY KEY' in col_def.upper():
+                if 'PRIMARY KEY' in upper:
                     constraint = UniqueConstraint(
                         is_primary_key=True,
                         is_managed=True,
@@ -276,7 +334,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 # Store REFERENCES for later resolution
                 # e.g., "customer_id INTEGER REFERENCES customers(id)"
                 if ref_info:
-                    self._pending_references.append((entity.name, ref_info[0], ref_info[1]))
+                    new_refs.append((entity.name, ref_info[0], ref_info[1]))
 
                 # Inline CHECK clause attached to this column. Anchor the
                 # CheckConstraint to the column's own meta_id — for
@@ -287,6 +345,17 @@ class PostgreSQLAdapter(DatabaseAdapter):
                         target_property_id=attr.meta_id,
                     ))
 
+        entity.add_properties(new_props)
+        self._pending_references.extend(new_refs)
+
+        # Column lookups for PRIMARY KEY (...) / UNIQUE (...) lists, built
+        # once per table instead of a get_property scan per listed column.
+        # First definition wins, as with get_property.
+        props_by_name: Dict[str, Property] = {}
+        if table_level_constraints:
+            for attr in entity.properties:
+                props_by_name.setdefault(attr.name, attr)
+
         # Parse table-level constraints. The four supported branches mirror
         # the keyword set collected on line 189: PRIMARY KEY, FOREIGN KEY,
         # UNIQUE, CHECK. Generic ``CONSTRAINT <name> ...`` is normalised by
@@ -297,21 +366,19 @@ class PostgreSQLAdapter(DatabaseAdapter):
             # Strip the optional ``CONSTRAINT <name>`` preamble so
             # ``CONSTRAINT pk_orders PRIMARY KEY (...)`` dispatches the same
             # way as a bare ``PRIMARY KEY (...)``.
-            named_match = re.match(
-                r'^CONSTRAINT\s+\w+\s+(.*)$', stripped, re.IGNORECASE | re.DOTALL,
-            )
+            named_match = _NAMED_CONSTRAINT_RE.match(stripped)
             if named_match:
                 stripped = named_match.group(1).strip()
             upper = stripped.upper()
 
             if upper.startswith('PRIMARY KEY') and not entity.get_primary_key():
                 # PRIMARY KEY (col1, col2, ...)
-                pk_match = re.search(r'PRIMARY\s+KEY\s*\(([^)]+)\)', stripped, re.IGNORECASE)
+                pk_match = _TABLE_PK_RE.search(stripped)
                 if pk_match:
                     pk_col_names = [c.strip() for c in pk_match.group(1).split(',')]
                     unique_props = []
                     for col_name in pk_col_names:
-                        attr = entity.get_property(col_name)
+                        attr = props_by_name.get(col_name)
                         if attr:
                             attr.is_key = True
                             unique_props.append(UniqueProperty(
@@ -331,10 +398,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 # composite FKs that must fold into ONE ForeignKeyConstraint with
                 # N ForeignKeyProperty entries (mirrors ADD_FOREIGN_KEY composite
                 # semantics in core.handlers.keys_constraints._handle_add_foreign_key).
-                fk_match = re.search(
-                    r'FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+(?:\w+\.)?(\w+)\s*\(([^)]+)\)',
-                    stripped, re.IGNORECASE,
-                )
+                fk_match = _TABLE_FK_RE.search(stripped)
                 if fk_match:
                     src_cols = [c.strip().lower() for c in fk_match.group(1).split(',')]
                     target_table = fk_match.group(2).lower()
@@ -348,12 +412,12 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
             elif upper.startswith('UNIQUE'):
                 # UNIQUE (a, b, ...) — table-level multi-column UNIQUE constraint.
-                u_match = re.search(r'UNIQUE\s*\(([^)]+)\)', stripped, re.IGNORECASE)
+                u_match = _TABLE_UNIQUE_RE.search(stripped)
                 if u_match:
                     u_col_names = [c.strip().lower() for c in u_match.group(1).split(',')]
                     unique_props = []
                     for col_name in u_col_names:
-                        attr = entity.get_property(col_name)
+                        attr = props_by_name.get(col_name)
                         if attr:
                             unique_props.append(UniqueProperty(
                                 primary_key_type=PKTypeEnum.SIMPLE,
@@ -375,7 +439,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 # arithmetic etc.) falls back to ``CheckRaw(<original text>)``
                 # so the constraint at least round-trips intact rather than
                 # being silently dropped.
-                m_chk = re.search(r'CHECK\s*\((.*)\)\s*$', stripped, re.IGNORECASE | re.DOTALL)
+                m_chk = _TABLE_CHECK_RE.search(stripped)
                 if m_chk:
                     expr_text = m_chk.group(1).strip()
                     expr_ast = self._parse_check_expression(expr_text)
@@ -406,8 +470,6 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         return entity
 
-    # ``_split_columns`` is inherited from DatabaseAdapter (shared with Cassandra).
-
     # ----------------------------------------------------------------------
     # SQL CHECK expression parsing — ``_parse_check_expression`` turns a SQL
     # boolean expression into the meta-model CheckExpr AST. Implemented as a
@@ -619,29 +681,39 @@ class PostgreSQLAdapter(DatabaseAdapter):
     def _parse_column(self, col_def: str) -> Tuple[Optional[Property], Optional[Tuple[str, str]], Optional[CheckExpr]]:
         """Parse a single column definition."""
         # Normalize whitespace (handle multi-line definitions)
-        col_def = ' '.join(col_def.split())
-
-        # Pattern: column_name TYPE [constraints] [REFERENCES table(col)]
-        # Handles: "id SERIAL", "name VARCHAR(100)", "price DOUBLE PRECISION"
-        pattern = r'^(\w+)\s+(\w+(?:\s+PRECISION)?)\s*(?:\(([^)]+)\))?\s*(.*)?$'
-        match = re.match(pattern, col_def.strip(), re.IGNORECASE)
-
-        if not match:
-            return None, None, None
-
-        col_name = match.group(1).lower()          # "customer_id"
-        col_type = match.group(2).upper()          # "INTEGER"
-        type_params = match.group(3)               # "100" for VARCHAR(100)
-        constraints = match.group(4) or ""         # "NOT NULL REFERENCES customers(id)"
+        words = col_def.split()
+
+        # ``str.isalnum`` is the same character class as ``\w`` minus '_'.
+        if len(words) == 2 and (words[0] + words[1]).replace('_', '').isalnum():
+            # Fast path for the dominant bare ``name TYPE`` column: no type
+            # params and no constraints, so the full pattern has nothing to add.
+            col_name = words[0].lower()
+            col_type = words[1].upper()
+            type_params = None
+            constraints = ""
+        else:
+            col_def = ' '.join(words)
+
+            # Pattern: column_name TYPE [constraints] [REFERENCES table(col)]
+            match = _COLUMN_RE.match(col_def)
+
+            if not match:
+                return None, None, None
+
+            col_name = match.group(1).lower()          # "customer_id"
+            col_type = match.group(2).upper()          # "INTEGER"
+            type_params = match.group(3)               # "100" for VARCHAR(100)
+            constraints = match.group(4) or ""         # "NOT NULL REFERENCES customers(id)"
 
         # Determine data type
         data_type = self._parse_data_type(col_type, type_params)
 
         # Check constraints
+        constraints_upper = constraints.upper()
         # is_key: PRIMARY KEY explicitly declared OR SERIAL type (auto-increment implies PK)
-        is_key = 'PRIMARY KEY' in constraints.upper() or col_type in ('SERIAL', 'BIGSERIAL')
+        is_key = 'PRIMARY KEY' in constraints_upper or col_type in ('SERIAL', 'BIGSERIAL')
         # is_optional: NOT NULL not present AND not a primary key
-        is_optional = 'NOT NULL' not in constraints.upper() and not is_key
+        is_optional = 'NOT NULL' not in constraints_upper and not is_key
         # is_auto_generated: source said SERIAL/BIGSERIAL (PG auto-increment).
         # Carries forward into the meta model so the export side can decide
         # whether to emit ``SERIAL`` or plain ``INTEGER`` instead of guessing
@@ -660,10 +732,13 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         # Check for REFERENCES clause (foreign key)
         # Pattern: REFERENCES target_table(target_column)
+        # Plain columns (``name VARCHAR(100)``) carry neither REFERENCES nor
+        # CHECK, so a substring test on the uppercased tail gates each regex.
         ref_info = None
-        ref_match = re.search(r'REFERENCES\s+(\w+)\s*\((\w+)\)', constraints, re.IGNORECASE)
-        if ref_match:
-            ref_info = (col_name, ref_match.group(1).lower())
+        if 'REFERENCES' in constraints_upper:
+            ref_match = _REFERENCES_RE.search(constraints)
+            if ref_match:
+                ref_info = (col_name, ref_match.group(1).lower())
 
         # Column-level CHECK clause: ``CHECK (<expr>)``. The expression is
         # parsed via the same path as table-level CHECK so the AST shape is
@@ -671,16 +746,17 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Re-uses the paren-balanced extractor below — naive ``)`` matching
         # would clip too early on expressions like ``CHECK (LOWER(x) = 'y')``.
         check_ast: Optional[CheckExpr] = None
-        check_text = self._extract_inline_check(constraints)
-        if check_text is not None:
-            check_ast = self._parse_check_expression(check_text)
+        if 'CHECK' in constraints_upper:
+            check_text = self._extract_inline_check(constraints)
+            if check_text is not None:
+                check_ast = self._parse_check_expression(check_text)
 
         return attr, ref_info, check_ast
 
     @staticmethod
     def _extract_inline_check(constraints: str) -> Optional[str]:
         """Pull the body of an inline ``CHECK (...)`` clause from the trailing"""
-        m = re.search(r'CHECK\s*\(', constraints, re.IGNORECASE)
+        m = _INLINE_CHECK_RE.search(constraints)
         if not m:
             return None
         # Walk forward from the opening paren of the CHECK clause to find
@@ -722,14 +798,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
         scale = None
 
         if params:
-            parts = [p.strip() for p in params.split(',')]
-            if primitive in (PrimitiveType.STRING, PrimitiveType.TEXT):
-                # VARCHAR(100) -> max_length=100
-                max_length = int(parts[0]) if parts else None
-            elif primitive == PrimitiveType.DECIMAL:
-                # DECIMAL(15,2) -> precision=15, scale=2
-                precision = int(parts[0]) if parts else None
-                scale = int(parts[1]) if len(parts) > 1 else 0
+            param_parser = self._TYPE_PARAM_PARSERS.get(primitive)
+            if param_parser is not None:
+                # int() tolerates the surrounding whitespace, so no strip pass.
+                max_length, precision, scale = getattr(self, param_parser)(params.split(','))
 
         return PrimitiveDataType(
             primitive_type=primitive,
@@ -738,6 +810,24 @@ class PostgreSQLAdapter(DatabaseAdapter):
             scale=scale
         )
 
+    @staticmethod
+    def _length_params(parts: List[str]) -> Tuple[Optional[int], None, None]:
+        """VARCHAR(100) -> max_length=100"""
+        return int(parts[0]), None, None
+
+    @staticmethod
+    def _decimal_params(parts: List[str]) -> Tuple[None, Optional[int], int]:
+        """DECIMAL(15,2) -> precision=15, scale=2"""
+        return None, int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
+
+    # Primitive type -> name of the method reading its ``(params)`` into
+    # ``(max_length, precision, scale)``; other types ignore their params.
+    _TYPE_PARAM_PARSERS = {
+        PrimitiveType.STRING: '_length_params',
+        PrimitiveType.TEXT: '_length_params',
+        PrimitiveType.DECIMAL: '_decimal_params',
+    }
+
     @staticmethod
     def _derive_fk_cardinalities(is_optional: bool, is_unique: bool):
         """Return ``(target_end_cardinality, source_end_cardinality)`` for a FK
@@ -888,26 +978,43 @@ class PostgreSQLAdapter(DatabaseAdapter):
     @classmethod
     def export_to_sql(cls, database: Database) -> str:
         """Export Unified Meta Schema to PostgreSQL DDL format."""
+        # Every block's lines go into one list so the whole script is joined
+        # once, with no per-table intermediate string.
         lines = []
+        for block in cls._iter_sql_blocks(database):
+            lines.extend(block)
+        return "\n".join(lines)
+
+    @classmethod
+    def _iter_sql_blocks(cls, database: Database) -> Iterator[List[str]]:
+        """Yield the export script as per-table line lists, in output order.
 
+        Joining every line of every block with ``"\n"`` gives the text of
+        ``export_to_sql``; ``export_to_sql_file`` writes block by block so only
+        one table's lines are held in memory at a time.
+        """
         # Sort entities by dependency order (entities with no FK first)
         # This ensures REFERENCES clauses point to existing tables
         sorted_entities = cls._sort_entities_by_dependency(database)
 
+        # Target-table PK column names, resolved once per export: a popular
+        # target (e.g. customers) is referenced by many FK columns.
+        pk_name_cache: Dict[str, str] = {}
+
         for entity in sorted_entities:
-            ddl = cls._export_entity_to_ddl(entity, database)
-            lines.append(ddl)
+            lines = []
+            cls._export_entity_to_ddl(entity, database, lines, pk_name_cache)
             lines.append("")
+            yield lines
 
         # Export RelationshipTypes as SQL comments (Graph metadata)
         if database.relationship_types:
-            lines.append("-- Relationship Types (Graph metadata):")
+            lines = ["-- Relationship Types (Graph metadata):"]
             for rt in database.relationship_types.values():
                 cardinality_str = rt.target_end_cardinality.value if rt.target_end_cardinality else "0..n"
                 lines.append(f"-- {rt.rel_name}: {rt.source_entity} -> {rt.target_entity} ({cardinality_str})")
             lines.append("")
-
-        return "\n".join(lines)
+            yield lines
 
     @classmethod
     def _sort_entities_by_dependency(cls, database: Database) -> list:
@@ -925,34 +1032,54 @@ class PostgreSQLAdapter(DatabaseAdapter):
                         deps.add(target)
             dependencies[entity.name] = deps
 
-        # Topological sort (DFS)
+        # Topological sort (DFS, post-order). Driven by an explicit stack of
+        # (name, dependency iterator) frames so long FK chains cannot hit the
+        # interpreter recursion limit; emission order matches a recursive walk.
         sorted_names = []
         visited = set()
 
-        def visit(name):
-            if name in visited:
-                return
-            visited.add(name)
-            # Visit dependencies first
-            for dep in dependencies.get(name, []):
-                if dep in dependencies:  # Only visit if entity exists
-                    visit(dep)
-            sorted_names.append(name)
-
-        for name in dependencies:
-            visit(name)
+        for root in dependencies:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(dependencies[root]))]
+            while stack:
+                name, pending = stack[-1]
+                for dep in pending:
+                    # Only visit if entity exists
+                    if dep in dependencies and dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, iter(dependencies[dep])))
+                        break
+                else:
+                    stack.pop()
+                    sorted_names.append(name)
 
-        return [database.get_entity_type(name) for name in sorted_names if database.get_entity_type(name)]
+        sorted_entities = []
+        for name in sorted_names:
+            entity = database.get_entity_type(name)
+            if entity:
+                sorted_entities.append(entity)
+        return sorted_entities
 
     @classmethod
-    def _export_entity_to_ddl(cls, entity: EntityType, database: Database) -> str:
-        """Export a single entity to CREATE TABLE DDL format."""
-        lines = []
+    def _export_entity_to_ddl(cls, entity: EntityType, database: Database, lines: List[str],
+                              pk_name_cache: Optional[Dict[str, str]] = None) -> None:
+        """Append a single entity's CREATE TABLE DDL lines to ``lines``."""
         lines.append(f"CREATE TABLE {entity.name} (")
 
         columns = []
         constraints = []
 
+        # One pass over properties / relationships up front; the constraint
+        # loops below then resolve property ids and reference names with dict
+        # lookups instead of a linear get_property_by_id scan per member.
+        props_by_id = {p.meta_id: p for p in entity.properties}
+        refs_by_name: Dict[str, Reference] = {}
+        for rel in entity.relationships:
+            if isinstance(rel, Reference):
+                refs_by_name.setdefault(rel.ref_name, rel)
+
         # Build FK lookup: column_name -> Reference relationship.
         # Columns that are part of a *composite* FK (≥2 columns folded into
         # one ForeignKeyConstraint) are excluded from the column-level
@@ -963,7 +1090,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         for c in entity.constraints:
             if c.kind == "foreign_key" and len(c.foreign_key_properties) >= 2:
                 for fkp in c.foreign_key_properties:
-                    fk_attr = entity.get_property_by_id(fkp.property_id)
+                    fk_attr = props_by_id.get(fkp.property_id)
                     if fk_attr:
                         composite_fk_cols.add(fk_attr.name)
 
@@ -977,7 +1104,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         pk_columns = []
         if pk_constraint and pk_constraint.unique_properties:
             for up in pk_constraint.unique_properties:
-                pk_attr = entity.get_property_by_id(up.property_id)
+                pk_attr = props_by_id.get(up.property_id)
                 if pk_attr:
                     pk_columns.append(pk_attr.name)
 
@@ -985,7 +1112,8 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         # Process properties -> columns
         for attr in entity.properties:
-            col_def = cls._export_property_to_column(attr, fk_refs.get(attr.name), database, is_composite_pk)
+            col_def = cls._export_property_to_column(attr, fk_refs.get(attr.name), database, is_composite_pk,
+                                                     pk_name_cache=pk_name_cache)
             columns.append(f"    {col_def}")
 
         # Add composite PRIMARY KEY constraint if needed
@@ -1004,7 +1132,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 continue
             uq_cols = []
             for up in c.unique_properties:
-                up_attr = entity.get_property_by_id(up.property_id)
+                up_attr = props_by_id.get(up.property_id)
                 if up_attr:
                     uq_cols.append(up_attr.name)
             if uq_cols:
@@ -1039,17 +1167,16 @@ class PostgreSQLAdapter(DatabaseAdapter):
             tgt_cols = []
             target_entity_name = ""
             for fkp in c.foreign_key_properties:
-                src_attr = entity.get_property_by_id(fkp.property_id)
+                src_attr = props_by_id.get(fkp.property_id)
                 if not src_attr:
                     continue
                 src_cols.append(src_attr.name)
                 # Locate target entity + column from any matching Reference.
                 # Composite FKs always share one target table across all members.
                 if not target_entity_name:
-                    for rel in entity.relationships:
-                        if isinstance(rel, Reference) and rel.ref_name == src_attr.name:
-                            target_entity_name = rel.get_target_entity_name()
-                            break
+                    rel = refs_by_name.get(src_attr.name)
+                    if rel is not None:
+                        target_entity_name = rel.get_target_entity_name()
                 tgt_cols.append(cls._resolve_fk_target_col(
                     fkp.points_to_unique_property_id, target_entity_name, database,
                 ))
@@ -1062,8 +1189,6 @@ class PostgreSQLAdapter(DatabaseAdapter):
         lines.append(",\n".join(columns))
         lines.append(");")
 
-        return "\n".join(lines)
-
     @classmethod
     def _resolve_fk_target_col(cls, target_up_id: str, target_entity_name: str,
                                database: Database) -> str:
@@ -1084,7 +1209,8 @@ class PostgreSQLAdapter(DatabaseAdapter):
         return ""
 
     @classmethod
-    def _export_property_to_column(cls, attr: Property, fk_ref: Reference = None, database: Database = None, is_composite_pk: bool = False) -> str:
+    def _export_property_to_column(cls, attr: Property, fk_ref: Reference = None, database: Database = None, is_composite_pk: bool = False,
+                                   pk_name_cache: Optional[Dict[str, str]] = None) -> str:
         """Export a property to column definition."""
         parts = [attr.name]
 
@@ -1105,7 +1231,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         if fk_ref:
             target_entity_name = fk_ref.get_target_entity_name()
             # Find target PK column from database metadata
-            target_pk_name = cls._get_target_pk_name(target_entity_name, database)
+            target_pk_name = cls._get_target_pk_name(target_entity_name, database, pk_name_cache)
             parts.append(f"REFERENCES {target_entity_name}({target_pk_name})")
 
         return " ".join(parts)
@@ -1113,28 +1239,24 @@ class PostgreSQLAdapter(DatabaseAdapter):
     @classmethod
     def _get_sql_type(cls, attr: Property) -> str:
         """Get SQL type string from property."""
+        dt = attr.data_type
         # Complex types -> JSONB in PostgreSQL
-        if isinstance(attr.data_type, ListDataType):
+        if isinstance(dt, (ListDataType, SetDataType, MapDataType)):
             return 'JSONB'
-        elif isinstance(attr.data_type, SetDataType):
-            return 'JSONB'
-        elif isinstance(attr.data_type, MapDataType):
-            return 'JSONB'
-        elif not isinstance(attr.data_type, PrimitiveDataType):
+        elif not isinstance(dt, PrimitiveDataType):
             return 'VARCHAR'
 
-        primitive = attr.data_type.primitive_type
-        base_type = cls.REVERSE_TYPE_MAP.get(primitive, 'VARCHAR')
+        base_type = cls.REVERSE_TYPE_MAP.get(dt.primitive_type, 'VARCHAR')
 
         # Handle VARCHAR with length
         if base_type == 'VARCHAR':
-            max_len = attr.data_type.max_length or 255
+            max_len = dt.max_length or 255
             return f"VARCHAR({max_len})"
 
         # Handle DECIMAL with precision/scale
         if base_type == 'DECIMAL':
-            precision = attr.data_type.precision or 13
-            scale = attr.data_type.scale or 2
+            precision = dt.precision or 13
+            scale = dt.scale or 2
             return f"DECIMAL({precision},{scale})"
 
         # SERIAL / BIGSERIAL only when the source explicitly flagged the column
@@ -1152,8 +1274,15 @@ class PostgreSQLAdapter(DatabaseAdapter):
         return base_type
 
     @classmethod
-    def _get_target_pk_name(cls, entity_name: str, database: Database = None) -> str:
+    def _get_target_pk_name(cls, entity_name: str, database: Database = None,
+                            cache: Optional[Dict[str, str]] = None) -> str:
         """Get the PK column name for a target entity."""
+        if cache is not None:
+            name = cache.get(entity_name)
+            if name is None:
+                name = cache[entity_name] = cls._get_target_pk_name(entity_name, database)
+            return name
+
         # Try to get PK from database metadata
         if database:
             target_entity = database.get_entity_type(entity_name)
@@ -1175,7 +1304,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
     @classmethod
     def export_to_sql_file(cls, database: Database, file_path: str) -> None:
-        """Export to SQL file."""
-        sql = cls.export_to_sql(database)
+        """Export to SQL file, streaming one table at a time."""
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(sql)
+            separator = ""
+            for block in cls._iter_sql_blocks(database):
+                if block:
+                    f.write(separator)
+                    f.write("\n".join(block))
+                    separator = "\n"
@@ -1,6 +1,8 @@
 # Unified Meta Schema - Supports: PostgreSQL, MongoDB, Neo4j, Cassandra
 # Based on AC's meta_model design with extensions
 
+import functools
+import itertools
 import json
 import logging
 import uuid
@@ -9,6 +11,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import ClassVar, Dict, List, Optional, Any, Union
 
+from ._json_io import load_json_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,22 +72,11 @@ class Cardinality(str, Enum):
 
     @classmethod
     def from_symbol(cls, s: str) -> 'Cardinality':
-        mapping = {
-            "?": cls.ZERO_TO_ONE, "0..1": cls.ZERO_TO_ONE,
-            "&": cls.ONE_TO_ONE, "1..1": cls.ONE_TO_ONE,
-            "*": cls.ZERO_TO_MANY, "0..n": cls.ZERO_TO_MANY,
-            "+": cls.ONE_TO_MANY, "1..n": cls.ONE_TO_MANY
-        }
-        return mapping.get(s, cls.ONE_TO_ONE)
+        return _SYMBOL_TO_CARDINALITY.get(s, cls.ONE_TO_ONE)
 
     def to_bounds(self) -> tuple:
         """Returns (min, max) bounds. -1 means unlimited."""
-        return {
-            self.ZERO_TO_ONE: (0, 1),
-            self.ONE_TO_ONE: (1, 1),
-            self.ZERO_TO_MANY: (0, -1),
-            self.ONE_TO_MANY: (1, -1)
-        }[self]
+        return _CARDINALITY_BOUNDS[self]
 
     def is_multiple(self) -> bool:
         return self in (self.ZERO_TO_MANY, self.ONE_TO_MANY)
@@ -92,6 +85,45 @@ class Cardinality(str, Enum):
         return self in (self.ONE_TO_ONE, self.ONE_TO_MANY)
 
 
+# Built once at import; Cardinality.from_symbol / to_bounds and the
+# Relationship bound properties run per relationship.
+_SYMBOL_TO_CARDINALITY: Dict[str, Cardinality] = {
+    "?": Cardinality.ZERO_TO_ONE, "0..1": Cardinality.ZERO_TO_ONE,
+    "&": Cardinality.ONE_TO_ONE, "1..1": Cardinality.ONE_TO_ONE,
+    "*": Cardinality.ZERO_TO_MANY, "0..n": Cardinality.ZERO_TO_MANY,
+    "+": Cardinality.ONE_TO_MANY, "1..n": Cardinality.ONE_TO_MANY
+}
+
+_CARDINALITY_BOUNDS: Dict[Cardinality, tuple] = {
+    Cardinality.ZERO_TO_ONE: (0, 1),
+    Cardinality.ONE_TO_ONE: (1, 1),
+    Cardinality.ZERO_TO_MANY: (0, -1),
+    Cardinality.ONE_TO_MANY: (1, -1)
+}
+
+# value -> member for the enums from_dict decodes with a fallback default:
+# a dict miss replaces EnumCls(value) plus a caught ValueError.
+_DATABASE_TYPE_BY_VALUE: Dict[str, DatabaseType] = {e.value: e for e in DatabaseType}
+_ENTITY_KIND_BY_VALUE: Dict[str, EntityKind] = {e.value: e for e in EntityKind}
+_PRIMITIVE_TYPE_BY_VALUE: Dict[str, PrimitiveType] = {e.value: e for e in PrimitiveType}
+_PK_TYPE_BY_VALUE: Dict[str, PKTypeEnum] = {e.value: e for e in PKTypeEnum}
+
+# member -> value for every enum to_dict serialises. ``member.value`` goes
+# through the Enum property descriptor on each read; a dict probe does not.
+# Members of different enums that compare equal (str mixins) share a value,
+# so one table serves them all.
+_ENUM_VALUE: Dict[Enum, str] = {
+    e: e.value
+    for enum_cls in (DatabaseType, EntityKind, PrimitiveType, PKTypeEnum, Cardinality)
+    for e in enum_cls
+}
+
+# Public accessor for serializers outside this module: ``enum_value(member)``
+# is ``member.value`` for the enums above (KeyError for anything else). Bound
+# to the table's ``__getitem__`` so a call stays a single C-level dict probe.
+enum_value = _ENUM_VALUE.__getitem__
+
+
 # SMILE STRING <-> META ENUM MAPPINGS
 # Translate SMILE-script literals into meta-model enum values. Centralized here
 # so that the transformer, validators, and any future consumer share one
@@ -131,9 +163,17 @@ TYPE_STR_MAP: Dict[str, PrimitiveType] = {
 _NATIVE_TYPE_REGISTRY: Dict[DatabaseType, Dict] = {}  # populated after TypeMappings class
 
 
+# (PrimitiveType, DatabaseType) -> native type string, flattened from
+# _NATIVE_TYPE_REGISTRY once it is populated (see below TypeMappings).
+_FLAT_NATIVE_TYPES: Dict[tuple, str] = {}
+
+
 def _get_native_type(ptype: PrimitiveType, db: DatabaseType) -> str:
     """Get native type string from PrimitiveType, using TypeMappings as single source."""
-    return _NATIVE_TYPE_REGISTRY[db].get(ptype, 'VARCHAR')
+    try:
+        return _FLAT_NATIVE_TYPES[ptype, db]
+    except KeyError:
+        return _NATIVE_TYPE_REGISTRY[db].get(ptype, 'VARCHAR')
 
 
 # ADAPTER TYPE MAPPINGS (Centralized)
@@ -373,34 +413,64 @@ _NATIVE_TYPE_REGISTRY[DatabaseType.RELATIONAL] = TypeMappings.PRIMITIVE_TO_POSTG
 _NATIVE_TYPE_REGISTRY[DatabaseType.DOCUMENT] = TypeMappings.PRIMITIVE_TO_MONGODB
 _NATIVE_TYPE_REGISTRY[DatabaseType.GRAPH] = TypeMappings.PRIMITIVE_TO_NEO4J
 _NATIVE_TYPE_REGISTRY[DatabaseType.COLUMNAR] = TypeMappings.PRIMITIVE_TO_CASSANDRA
+_FLAT_NATIVE_TYPES.update(
+    ((pt, db), mapping.get(pt, 'VARCHAR'))
+    for db, mapping in _NATIVE_TYPE_REGISTRY.items()
+    for pt in PrimitiveType
+)
 
 
 # DATA TYPES
 
+# meta_ids only need to be unique, not unpredictable: one random per-process
+# prefix plus a counter avoids a uuid4() (an os.urandom read) per object, and
+# the prefix keeps ids from colliding with ids loaded from another run's JSON
+# or with ordinary string values rewritten by ``_apply_id_map``.
+_UID_PREFIX = uuid.uuid4().hex
+_uid_counter = itertools.count()
+
+
 def _uid() -> str:
-    return str(uuid.uuid4())
+    return f"{_UID_PREFIX}-{next(_uid_counter)}"
+
+
+# Public name for code outside this module that re-keys copied objects.
+new_meta_id = _uid
 
 
 def _apply_id_map(obj: Any, id_map: Dict[str, str]) -> Any:
     """Recursively rebuild ``obj`` with every string value rewritten via ``id_map``."""
     if isinstance(obj, dict):
-        return {k: _apply_id_map(v, id_map) for k, v in obj.items()}
+        return {k: _map_id_value(v, id_map) for k, v in obj.items()}
     if isinstance(obj, list):
-        return [_apply_id_map(v, id_map) for v in obj]
+        return [_map_id_value(v, id_map) for v in obj]
     if isinstance(obj, str):
         return id_map.get(obj, obj)
     return obj
 
 
-@dataclass
-class DataType(ABC):
-    @abstractmethod
+def _map_id_value(v: Any, id_map: Dict[str, str]) -> Any:
+    """One container member for ``_apply_id_map``. Exact-type checks settle
+    the common leaves (plain str / bool / int / None) in place, so the
+    recursive call is only paid for nested containers."""
+    t = type(v)
+    if t is str:
+        return id_map.get(v, v)
+    if t is bool or t is int or v is None:
+        return v
+    return _apply_id_map(v, id_map)
+
+
+# DataType and Relationship are plain base classes, not ABCs: the type checks
+# that filter on their subclasses (``isinstance(r, Reference)`` per relationship)
+# skip ABCMeta.__instancecheck__, which is ~3x slower on a miss.
+@dataclass(slots=True, frozen=True)
+class DataType:
     def to_native(self, db: DatabaseType) -> str:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
-        pass
+        raise NotImplementedError
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DataType':
@@ -419,7 +489,42 @@ class DataType(ABC):
         raise ValueError(f"Unknown DataType kind: {kind}")
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _primitive_native(ptype: PrimitiveType, max_length: Optional[int], precision: Optional[int],
+                      scale: Optional[int], db: DatabaseType) -> str:
+    """Native type string for a primitive type. Memoized: a schema holds many
+    structurally identical columns (e.g. hundreds of VARCHAR(255))."""
+    # Only parameterised relational VARCHAR / DECIMAL need formatting;
+    # everything else is a single table lookup.
+    if db == DatabaseType.RELATIONAL and (max_length or precision):
+        if ptype == PrimitiveType.STRING and max_length:
+            return f"VARCHAR({max_length})"
+        if ptype == PrimitiveType.DECIMAL and precision:
+            return f"DECIMAL({precision},{scale or 0})"
+    return _get_native_type(ptype, db)
+
+
+# Per-database wrappers for collection element types; databases not listed
+# render the collection as a plain "array" without visiting the element.
+_LIST_NATIVE_FORMATS: Dict[DatabaseType, str] = {
+    DatabaseType.RELATIONAL: "{}[]",
+    DatabaseType.GRAPH: "List<{}>",
+    DatabaseType.COLUMNAR: "list<{}>",
+}
+
+_SET_NATIVE_FORMATS: Dict[DatabaseType, str] = {
+    DatabaseType.RELATIONAL: "{}[]",
+    DatabaseType.COLUMNAR: "set<{}>",
+}
+
+_MAP_NATIVE_NAMES: Dict[DatabaseType, str] = {
+    DatabaseType.RELATIONAL: "JSONB",
+    DatabaseType.DOCUMENT: "object",
+    DatabaseType.GRAPH: "Map",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PrimitiveDataType(DataType):
     primitive_type: PrimitiveType
     max_length: Optional[int] = None
@@ -427,16 +532,10 @@ class PrimitiveDataType(DataType):
     scale: Optional[int] = None
 
     def to_native(self, db: DatabaseType) -> str:
-        base = _get_native_type(self.primitive_type, db)
-        if db == DatabaseType.RELATIONAL:
-            if self.primitive_type == PrimitiveType.STRING and self.max_length:
-                return f"VARCHAR({self.max_length})"
-            if self.primitive_type == PrimitiveType.DECIMAL and self.precision:
-                return f"DECIMAL({self.precision},{self.scale or 0})"
-        return base
+        return _primitive_native(self.primitive_type, self.max_length, self.precision, self.scale, db)
 
     def to_dict(self) -> Dict[str, Any]:
-        d = {"kind": "primitive", "type": self.primitive_type.value}
+        d = {"kind": "primitive", "type": _ENUM_VALUE[self.primitive_type]}
         if self.max_length is not None:
             d["max_length"] = self.max_length
         if self.precision is not None:
@@ -447,30 +546,36 @@ class PrimitiveDataType(DataType):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PrimitiveDataType':
-        try:
-            pt = PrimitiveType(data.get("type", "string"))
-        except ValueError:
-            pt = PrimitiveType.STRING
+        pt = _PRIMITIVE_TYPE_BY_VALUE.get(data.get("type", "string"), PrimitiveType.STRING)
+        max_length = data.get("max_length")
+        precision = data.get("precision")
+        scale = data.get("scale")
+        if max_length is None and precision is None and scale is None and cls is PrimitiveDataType:
+            return _PRIMITIVE_SINGLETONS[pt]
         return cls(
             primitive_type=pt,
-            max_length=data.get("max_length"),
-            precision=data.get("precision"),
-            scale=data.get("scale")
+            max_length=max_length,
+            precision=precision,
+            scale=scale
         )
 
 
-@dataclass
+# One shared instance per parameterless primitive type. Data types are frozen
+# value objects, so the same instance can back any number of properties.
+_PRIMITIVE_SINGLETONS: Dict[PrimitiveType, PrimitiveDataType] = {
+    pt: PrimitiveDataType(pt) for pt in PrimitiveType
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ListDataType(DataType):
     element_type: DataType
 
     def to_native(self, db: DatabaseType) -> str:
-        m = {
-            DatabaseType.RELATIONAL: f"{self.element_type.to_native(db)}[]",
-            DatabaseType.DOCUMENT: "array",
-            DatabaseType.GRAPH: f"List<{self.element_type.to_native(db)}>",
-            DatabaseType.COLUMNAR: f"list<{self.element_type.to_native(db)}>"
-        }
-        return m.get(db, "array")
+        fmt = _LIST_NATIVE_FORMATS.get(db)
+        if fmt is None:
+            return "array"
+        return fmt.format(self.element_type.to_native(db))
 
     def to_dict(self) -> Dict[str, Any]:
         return {"kind": "list", "element_type": self.element_type.to_dict()}
@@ -481,14 +586,15 @@ class ListDataType(DataType):
         return cls(element_type=element_type)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SetDataType(DataType):
     element_type: DataType
 
     def to_native(self, db: DatabaseType) -> str:
-        if db == DatabaseType.COLUMNAR:
-            return f"set<{self.element_type.to_native(db)}>"
-        return f"{self.element_type.to_native(db)}[]" if db == DatabaseType.RELATIONAL else "array"
+        fmt = _SET_NATIVE_FORMATS.get(db)
+        if fmt is None:
+            return "array"
+        return fmt.format(self.element_type.to_native(db))
 
     def to_dict(self) -> Dict[str, Any]:
         return {"kind": "set", "element_type": self.element_type.to_dict()}
@@ -499,15 +605,15 @@ class SetDataType(DataType):
         return cls(element_type=element_type)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MapDataType(DataType):
     key_type: DataType
     value_type: DataType
 
     def to_native(self, db: DatabaseType) -> str:
-        if db == DatabaseType.COLUMNAR:
+        if db is DatabaseType.COLUMNAR:
             return f"map<{self.key_type.to_native(db)}, {self.value_type.to_native(db)}>"
-        return {"RELATIONAL": "JSONB", "DOCUMENT": "object", "GRAPH": "Map"}.get(db.name, "JSONB")
+        return _MAP_NATIVE_NAMES.get(db, "JSONB")
 
     def to_dict(self) -> Dict[str, Any]:
         return {"kind": "map", "key_type": self.key_type.to_dict(), "value_type": self.value_type.to_dict()}
@@ -519,7 +625,7 @@ class MapDataType(DataType):
         return cls(key_type=key_type, value_type=value_type)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TupleDataType(DataType):
     """Tuple data type: ordered collection of typed elements. M-Model+ extension."""
     elem_types: List[DataType] = field(default_factory=list)
@@ -541,9 +647,28 @@ class TupleDataType(DataType):
         return cls(elem_types=elem_types)
 
 
+def _data_type_from_dict(data: Dict[str, Any], cache: Optional[Dict[tuple, DataType]]) -> DataType:
+    """``DataType.from_dict`` that reuses one PrimitiveDataType per distinct
+    (type, max_length, precision, scale) through ``cache`` when one is given."""
+    if cache is None or data.get("kind", "primitive") != "primitive":
+        return DataType.from_dict(data)
+    key = (data.get("type", "string"), data.get("max_length"), data.get("precision"), data.get("scale"))
+    try:
+        return cache[key]
+    except KeyError:
+        dt = cache[key] = PrimitiveDataType.from_dict(data)
+        return dt
+    except TypeError:  # unhashable (malformed) field values: no sharing
+        return PrimitiveDataType.from_dict(data)
+
+
 # PROPERTY (formerly Attribute)
+# Properties, key members, key constraints and relationships are identity
+# objects (each carries its own meta_id), so they compare with ``is``
+# (``eq=False``) rather than a generated field-by-field ``__eq__``. Data types
+# stay value objects with structural equality.
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Property:
     name: str
     data_type: DataType
@@ -584,8 +709,9 @@ class Property:
         return d
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Property':
-        dt = DataType.from_dict(data.get("data_type", {"kind": "primitive", "type": "string"}))
+    def from_dict(cls, data: Dict[str, Any],
+                  dtype_cache: Optional[Dict[tuple, DataType]] = None) -> 'Property':
+        dt = _data_type_from_dict(data.get("data_type", {"kind": "primitive", "type": "string"}), dtype_cache)
         return cls(
             name=data.get("name", data.get("attr_name", "")),
             data_type=dt,
@@ -596,13 +722,13 @@ class Property:
             # do not carry this key round-trip cleanly. Symmetric with
             # ``to_dict`` which emits the key only when True.
             is_auto_generated=data.get("is_auto_generated", False),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
 
 # CONSTRAINTS (from AC)
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UniqueProperty:
     """Property that is part of a unique/primary key constraint (from AC)."""
     primary_key_type: PKTypeEnum
@@ -621,7 +747,7 @@ class UniqueProperty:
     def to_dict(self) -> Dict[str, Any]:
         d = {
             "meta_id": self.meta_id,
-            "primary_key_type": self.primary_key_type.value,
+            "primary_key_type": _ENUM_VALUE[self.primary_key_type],
             "property_id": self.property_id,
         }
         # Emit only when set (non-None) so existing JSON snapshots stay
@@ -632,19 +758,16 @@ class UniqueProperty:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UniqueProperty':
-        try:
-            pk_type = PKTypeEnum(data.get("primary_key_type", "simple"))
-        except ValueError:
-            pk_type = PKTypeEnum.SIMPLE
+        pk_type = _PK_TYPE_BY_VALUE.get(data.get("primary_key_type", "simple"), PKTypeEnum.SIMPLE)
         return cls(
             primary_key_type=pk_type,
             property_id=data.get("property_id", ""),
             clustering_order=data.get("clustering_order"),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ForeignKeyProperty:
     """Property that is part of a foreign key constraint (from AC)."""
     property_id: str  # References Property.meta_id (the FK column)
@@ -667,6 +790,8 @@ class ForeignKeyProperty:
 class Constraint(ABC):
     """Abstract base class for constraints."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         pass
@@ -686,7 +811,7 @@ class Constraint(ABC):
         raise ValueError(f"Unknown constraint type: {constraint_type}")
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UniqueConstraint(Constraint):
     """Unique or Primary Key constraint (from AC)."""
     kind: ClassVar[str] = "unique"
@@ -716,7 +841,7 @@ class UniqueConstraint(Constraint):
         return [up.property_id for up in self.unique_properties]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ForeignKeyConstraint(Constraint):
     """Foreign Key constraint (from AC)."""
     kind: ClassVar[str] = "foreign_key"
@@ -750,7 +875,7 @@ class ForeignKeyConstraint(Constraint):
 # them; Raw is the escape hatch for predicates the structured grammar cannot
 # represent.
 
-@dataclass
+@dataclass(slots=True)
 class CheckExpr(ABC):
     """Abstract base for CHECK expression nodes."""
 
@@ -773,7 +898,7 @@ class CheckExpr(ABC):
         raise ValueError(f"Unknown CheckExpr kind: {kind}")
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckCmp(CheckExpr):
     """Atomic comparison: <field_name> <op> <literal>. op in {<, >, <=, >=, ==, !=}."""
     field_name: str = ""
@@ -788,7 +913,7 @@ class CheckCmp(CheckExpr):
         return cls(field_name=data["field"], op=data["op"], literal=data.get("literal"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckIn(CheckExpr):
     """Membership: <field_name> IN (v1, v2, ...)."""
     field_name: str = ""
@@ -802,7 +927,7 @@ class CheckIn(CheckExpr):
         return cls(field_name=data["field"], values=list(data.get("values", [])))
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckBetween(CheckExpr):
     """Range: <field_name> BETWEEN <low> AND <high>."""
     field_name: str = ""
@@ -817,7 +942,7 @@ class CheckBetween(CheckExpr):
         return cls(field_name=data["field"], low=data.get("low"), high=data.get("high"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckRegex(CheckExpr):
     """Pattern match: <field_name> MATCHES "<pattern>"."""
     field_name: str = ""
@@ -831,7 +956,7 @@ class CheckRegex(CheckExpr):
         return cls(field_name=data["field"], pattern=data.get("pattern", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckIsNull(CheckExpr):
     """Null check: <field_name> IS NULL or IS NOT NULL (is_null flips meaning)."""
     field_name: str = ""
@@ -845,7 +970,7 @@ class CheckIsNull(CheckExpr):
         return cls(field_name=data["field"], is_null=data.get("is_null", True))
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckAnd(CheckExpr):
     """Conjunction: <left> AND <right>."""
     left: Optional[CheckExpr] = None
@@ -863,7 +988,7 @@ class CheckAnd(CheckExpr):
         return cls(left=l, right=r)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckOr(CheckExpr):
     """Disjunction: <left> OR <right>."""
     left: Optional[CheckExpr] = None
@@ -881,7 +1006,7 @@ class CheckOr(CheckExpr):
         return cls(left=l, right=r)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckNot(CheckExpr):
     """Negation: NOT <expr>."""
     expr: Optional[CheckExpr] = None
@@ -895,7 +1020,7 @@ class CheckNot(CheckExpr):
         return cls(expr=e)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckRaw(CheckExpr):
     """Escape hatch: arbitrary predicate text. Adapter visitors fall back to"""
     raw_text: str = ""
@@ -916,7 +1041,7 @@ class CheckRaw(CheckExpr):
 # (the third ADD_CONSTRAINT branch) re-use the existing ``Reference`` object
 # with ``is_enforced=False``, not a dedicated Constraint subclass.
 
-@dataclass
+@dataclass(slots=True)
 class CheckConstraint(Constraint):
     """CHECK predicate over one or more properties of an entity."""
     kind: ClassVar[str] = "check"
@@ -943,7 +1068,7 @@ class CheckConstraint(Constraint):
                    constraint_name=data.get("constraint_name", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class ExistenceConstraint(Constraint):
     """A property must always have a value. Equivalent to NOT NULL but expressed"""
     kind: ClassVar[str] = "existence"
@@ -974,7 +1099,7 @@ class TraceOrigin(str, Enum):
     UNNESTED_EMBEDDED_REF = "unnested_embedded_ref"  # UNNEST preserving a cross-collection Reference
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipTrace:
     """Transformation-time auxiliary structure: a typed record of a relationship
     that was destroyed by an operation (DELETE_FOREIGN_KEY, DELETE_PROPERTY,
@@ -993,8 +1118,8 @@ class RelationshipTrace:
     origin: TraceOrigin = TraceOrigin.DELETED_REFERENCE
 
 
-@dataclass
-class Relationship(ABC):
+@dataclass(slots=True, eq=False)
+class Relationship:
     """Base for Reference / Embedded / Edge.
 
     Cardinality is bidirectional. Each field is named after the end of the
@@ -1014,19 +1139,17 @@ class Relationship(ABC):
 
     @property
     def lower_bound(self) -> int:
-        return self.target_end_cardinality.to_bounds()[0]
+        return _CARDINALITY_BOUNDS[self.target_end_cardinality][0]
 
     @property
     def upper_bound(self) -> int:
-        return self.target_end_cardinality.to_bounds()[1]
+        return _CARDINALITY_BOUNDS[self.target_end_cardinality][1]
 
-    @abstractmethod
     def get_target_entity_name(self) -> str:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
-        pass
+        raise NotImplementedError
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Relationship':
@@ -1041,7 +1164,7 @@ class Relationship(ABC):
         raise ValueError(f"Unknown relationship kind: {kind}")
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Reference(Relationship):
     ref_name: str = ""
     refs_to: str = ""  # Entity name (string only, not object reference)
@@ -1063,11 +1186,11 @@ class Reference(Relationship):
             "meta_id": self.meta_id,
             "ref_name": self.ref_name,
             "refs_to": self.refs_to,
-            "target_end_cardinality": self.target_end_cardinality.value,
+            "target_end_cardinality": _ENUM_VALUE[self.target_end_cardinality],
             "is_optional": self.is_optional
         }
         if self.source_end_cardinality is not None:
-            d["source_end_cardinality"] = self.source_end_cardinality.value
+            d["source_end_cardinality"] = _ENUM_VALUE[self.source_end_cardinality]
         # Emit ``is_enforced`` only when the reference is logical so that JSON
         # output for every existing Reference (which all default to enforced)
         # remains byte-identical to the pre-feature serialization.
@@ -1091,13 +1214,13 @@ class Reference(Relationship):
             source_end_cardinality=source_end_cardinality,
             is_optional=data.get("is_optional", True),
             description=data.get("description"),
-            meta_id=data.get("meta_id", _uid()),
+            meta_id=data["meta_id"] if "meta_id" in data else _uid(),
             edge_properties=edge_props,
             is_enforced=data.get("is_enforced", True)
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Embedded(Relationship):
     """Embedded/Aggregate relationship for nested documents (MongoDB style)."""
     aggr_name: str = ""
@@ -1115,12 +1238,12 @@ class Embedded(Relationship):
             "meta_id": self.meta_id,
             "aggr_name": self.aggr_name,
             "aggregates": self.aggregates,
-            "target_end_cardinality": self.target_end_cardinality.value,
+            "target_end_cardinality": _ENUM_VALUE[self.target_end_cardinality],
             "is_optional": self.is_optional,
             "is_array": self.is_array()
         }
         if self.source_end_cardinality is not None:
-            d["source_end_cardinality"] = self.source_end_cardinality.value
+            d["source_end_cardinality"] = _ENUM_VALUE[self.source_end_cardinality]
         if self.description:
             d["description"] = self.description
         return d
@@ -1136,11 +1259,11 @@ class Embedded(Relationship):
             source_end_cardinality=source_end_cardinality,
             is_optional=data.get("is_optional", True),
             description=data.get("description"),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Edge(Relationship):
     """Graph edge relationship. M-Model+ extension: part of the Reference / Embedded / Edge hierarchy that replaces the original flat connector model."""
     rel_type_name: str = ""    # Name of the RelationshipType (e.g. "PURCHASED")
@@ -1157,11 +1280,11 @@ class Edge(Relationship):
             "rel_type_name": self.rel_type_name,
             "source_entity": self.source_entity,
             "target_entity": self.target_entity,
-            "target_end_cardinality": self.target_end_cardinality.value,
+            "target_end_cardinality": _ENUM_VALUE[self.target_end_cardinality],
             "is_optional": self.is_optional
         }
         if self.source_end_cardinality is not None:
-            d["source_end_cardinality"] = self.source_end_cardinality.value
+            d["source_end_cardinality"] = _ENUM_VALUE[self.source_end_cardinality]
         if self.description:
             d["description"] = self.description
         return d
@@ -1178,13 +1301,22 @@ class Edge(Relationship):
             source_end_cardinality=source_end_cardinality,
             is_optional=data.get("is_optional", True),
             description=data.get("description"),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
 
+# Relationship class -> field holding its name (ref_name / aggr_name /
+# rel_type_name); one dict probe per member instead of an isinstance chain.
+_RELATIONSHIP_NAME_ATTR: Dict[type, str] = {
+    Reference: "ref_name",
+    Embedded: "aggr_name",
+    Edge: "rel_type_name",
+}
+
+
 # ENTITY TYPE
 
-@dataclass
+@dataclass(slots=True)
 class EntityType:
     """Unifies the definition of database entities (from AC with List[str] naming)."""
     object_name: List[str]  # from AC: ["schema", "table"] or ["collection", "embedded"]
@@ -1243,12 +1375,25 @@ class EntityType:
     def add_property(self, attr: Property):
         self.properties.append(attr)
 
+    def add_properties(self, attrs: List[Property]):
+        """Append several properties at once, in order."""
+        self.properties.extend(attrs)
+
+    # Lookups scan ``properties`` directly: handlers mutate the list and
+    # rename properties in place, so a side index would go stale. A plain
+    # loop avoids the generator frame ``next(...)`` would set up per call.
     def get_property(self, name: str) -> Optional[Property]:
-        return next((a for a in self.properties if a.name == name), None)
+        for a in self.properties:
+            if a.name == name:
+                return a
+        return None
 
     def get_property_by_id(self, meta_id: str) -> Optional[Property]:
         """Get property by its meta_id (used for constraint property_id lookup)."""
-        return next((a for a in self.properties if a.meta_id == meta_id), None)
+        for a in self.properties:
+            if a.meta_id == meta_id:
+                return a
+        return None
 
     def remove_property(self, name: str) -> Optional[Property]:
         for i, a in enumerate(self.properties):
@@ -1273,15 +1418,8 @@ class EntityType:
 
     def remove_relationship(self, name: str) -> Optional[Relationship]:
         for i, r in enumerate(self.relationships):
-            if isinstance(r, Reference):
-                rel_name = r.ref_name
-            elif isinstance(r, Embedded):
-                rel_name = r.aggr_name
-            elif isinstance(r, Edge):
-                rel_name = r.rel_type_name
-            else:
-                continue
-            if rel_name == name:
+            name_attr = _RELATIONSHIP_NAME_ATTR.get(r.__class__)
+            if name_attr is not None and getattr(r, name_attr) == name:
                 return self.relationships.pop(i)
         return None
 
@@ -1289,7 +1427,7 @@ class EntityType:
         d = {
             "meta_id": self.meta_id,
             "object_name": self.object_name,  # from AC: List[str]
-            "entity_kind": self.entity_kind.value,
+            "entity_kind": _ENUM_VALUE[self.entity_kind],
             "is_root": self.is_root,
             "constraints": [c.to_dict() for c in self.constraints],
             "properties": [a.to_dict() for a in self.properties],
@@ -1300,22 +1438,20 @@ class EntityType:
         if self.target_entity is not None:
             d["target_entity"] = self.target_entity
         if self.edge_target_end_cardinality is not None:
-            d["edge_target_end_cardinality"] = self.edge_target_end_cardinality.value
+            d["edge_target_end_cardinality"] = _ENUM_VALUE[self.edge_target_end_cardinality]
         if self.edge_source_end_cardinality is not None:
-            d["edge_source_end_cardinality"] = self.edge_source_end_cardinality.value
+            d["edge_source_end_cardinality"] = _ENUM_VALUE[self.edge_source_end_cardinality]
         if self.description:
             d["description"] = self.description
         return d
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'EntityType':
-        try:
-            kind = EntityKind(data.get("entity_kind", "table"))
-        except ValueError:
-            kind = EntityKind.TABLE
+    def from_dict(cls, data: Dict[str, Any],
+                  dtype_cache: Optional[Dict[tuple, DataType]] = None) -> 'EntityType':
+        kind = _ENTITY_KIND_BY_VALUE.get(data.get("entity_kind", "table"), EntityKind.TABLE)
 
         constraints = [Constraint.from_dict(c) for c in data.get("constraints", [])]
-        attrs = [Property.from_dict(a) for a in data.get("properties", [])]
+        attrs = [Property.from_dict(a, dtype_cache) for a in data.get("properties", [])]
         rels = [Relationship.from_dict(r) for r in data.get("relationships", [])]
 
         object_name = data.get("object_name") or [""]
@@ -1338,13 +1474,13 @@ class EntityType:
             edge_target_end_cardinality=edge_target_end_cardinality,
             edge_source_end_cardinality=edge_source_end_cardinality,
             description=data.get("description"),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
 
 # RELATIONSHIP TYPE (Neo4j edge type)
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipType:
     """Neo4j edge type."""
     rel_name: str
@@ -1377,10 +1513,10 @@ class RelationshipType:
             "source_entity": self.source_entity,
             "target_entity": self.target_entity,
             "properties": [a.to_dict() for a in self.properties],
-            "target_end_cardinality": self.target_end_cardinality.value
+            "target_end_cardinality": _ENUM_VALUE[self.target_end_cardinality]
         }
         if self.source_end_cardinality is not None:
-            d["source_end_cardinality"] = self.source_end_cardinality.value
+            d["source_end_cardinality"] = _ENUM_VALUE[self.source_end_cardinality]
         if self.bidirectional is not None:
             d["bidirectional"] = self.bidirectional
         if self.description:
@@ -1401,13 +1537,13 @@ class RelationshipType:
             source_end_cardinality=source_end_cardinality,
             bidirectional=data.get("bidirectional"),
             description=data.get("description"),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
 
 # DATABASE (TOP-LEVEL)
 
-@dataclass
+@dataclass(slots=True)
 class Database:
     db_name: str
     db_type: DatabaseType = DatabaseType.RELATIONAL
@@ -1480,7 +1616,7 @@ class Database:
         d: Dict[str, Any] = {
             "meta_id": self.meta_id,
             "db_name": self.db_name,
-            "db_type": self.db_type.value,
+            "db_type": _ENUM_VALUE[self.db_type],
             "version": self.version,
             "entity_types": {n: e.to_dict() for n, e in self.entity_types.items()},
         }
@@ -1491,7 +1627,7 @@ class Database:
                 "source_entity": e.source_entity or "",
                 "target_entity": e.target_entity or "",
                 "properties": [a.to_dict() for a in e.properties],
-                "target_end_cardinality": (e.edge_target_end_cardinality or Cardinality.ZERO_TO_MANY).value,
+                "target_end_cardinality": _ENUM_VALUE[e.edge_target_end_cardinality or Cardinality.ZERO_TO_MANY],
             } for n, e in edge_entities.items()}
         if self.description:
             d["description"] = self.description
@@ -1524,34 +1660,39 @@ class Database:
         return json.dumps(self.to_dict(), indent=indent)
 
     def save_to_file(self, path: str):
+        # Same text as ``to_json()``; stdlib ``json`` keeps ints of any width.
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(self.to_json())
+            json.dump(self.to_dict(), f, indent=2)
 
     # Deserialization
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Database':
-        try:
-            db_type = DatabaseType(data.get("db_type", "relational"))
-        except ValueError:
-            db_type = DatabaseType.RELATIONAL
+        db_type = _DATABASE_TYPE_BY_VALUE.get(data.get("db_type", "relational"), DatabaseType.RELATIONAL)
 
         db = cls(
             db_name=data.get("db_name", "unknown"),
             db_type=db_type,
             version=data.get("version", 1),
             description=data.get("description"),
-            meta_id=data.get("meta_id", _uid())
+            meta_id=data["meta_id"] if "meta_id" in data else _uid()
         )
 
+        # Structurally identical primitive column types (hundreds of plain
+        # VARCHAR / INTEGER columns) share one PrimitiveDataType per load.
+        # That covers entity properties and relationship-type (EDGE entity)
+        # properties; only a Reference's edge_properties, decoded inside
+        # Relationship.from_dict, get their own instances.
+        dtype_cache: Dict[tuple, DataType] = {}
+
         # Load entity types
         for e_data in data.get("entity_types", {}).values():
-            entity = EntityType.from_dict(e_data)
+            entity = EntityType.from_dict(e_data, dtype_cache)
             db.add_entity_type(entity)
 
         # Load relationship types as EDGE entities
         for r_data in data.get("relationship_types", {}).values():
             rel_name = r_data.get("rel_name", "")
-            attrs = [Property.from_dict(a) for a in r_data.get("properties", [])]
+            attrs = [Property.from_dict(a, dtype_cache) for a in r_data.get("properties", [])]
             card_str = r_data.get("target_end_cardinality", "0..n")
             edge_entity = EntityType(
                 object_name=[rel_name],
@@ -1560,7 +1701,7 @@ class Database:
                 target_entity=r_data.get("target_entity", ""),
                 edge_target_end_cardinality=Cardinality.from_symbol(card_str),
                 properties=attrs,
-                meta_id=r_data.get("meta_id", _uid())
+                meta_id=r_data["meta_id"] if "meta_id" in r_data else _uid()
             )
             db.add_entity_type(edge_entity)
 
@@ -1568,8 +1709,7 @@ class Database:
 
     @classmethod
     def load_from_file(cls, path: str) -> 'Database':
-        with open(path, 'r', encoding='utf-8') as f:
-            return cls.from_dict(json.load(f))
+        return cls.from_dict(load_json_file(path))
 
 
 # Alias
@@ -1582,5 +1722,5 @@ __all__ = [
     'UniqueConstraint', 'ForeignKeyConstraint',
     'Relationship', 'Reference', 'Embedded', 'Edge',
     'EntityType',
-    'Database', 'UnifiedMetaSchema', 'TypeMappings'
+    'Database', 'UnifiedMetaSchema', 'TypeMappings', 'new_meta_id', 'enum_value',
 ]
@@ -12,13 +12,12 @@ from Schema.unified_meta_schema import (
     CARDINALITY_MAP, TYPE_STR_MAP,
 )
 from parser.params import (
-    OperationResult,
+    OpType, OperationResult,
     AddEntityParams, DeleteEntityParams, RenameEntityParams, CopyEntityParams,
     AddPropertyParams, DeletePropertyParams, RenamePropertyParams,
     CopyPropertyParams, MovePropertyParams,
     AddEmbeddedParams, DeleteEmbeddedParams,
 )
-from parser.listeners import OpType
 from core.transformer import register_handler
 
 logger = logging.getLogger(__name__)
@@ -12,14 +12,13 @@ from Schema.unified_meta_schema import (
     CARDINALITY_MAP, KEY_TYPE_MAP, TYPE_STR_MAP,
 )
 from parser.params import (
-    OperationResult,
+    OpType, OperationResult,
     AddKeyParams, DeleteKeyParams,
     AddForeignKeyParams, DeleteForeignKeyParams, CastConstraintParams,
     AddConstraintParams, DeleteConstraintParams, ConstraintBodyKind,
     AddLabelParams, DeleteLabelParams,
     RecardParams, TransformParams,
 )
-from parser.listeners import OpType
 from core.transformer import register_handler
 
 logger = logging.getLogger(__name__)
@@ -700,7 +699,7 @@ class KeysConstraintsHandlersMixin:
                     if fk_attr:
                         fk_attr_names.add(fk_attr.name)
                 if fk_attr_names == key_columns_set:
-                    entity.constraints.remove(constraint)
+                    self._remove_identical(entity.constraints, constraint)
                     for fk_prop in constraint.foreign_key_properties:
                         fk_attr = entity.get_property_by_id(fk_prop.property_id)
                         if fk_attr:
@@ -719,7 +718,7 @@ class KeysConstraintsHandlersMixin:
                         if up_attr:
                             constraint_attr_names.add(up_attr.name)
                     if constraint_attr_names == key_columns_set:
-                        entity.constraints.remove(constraint)
+                        self._remove_identical(entity.constraints, constraint)
                         for up in constraint.unique_properties:
                             up_attr = entity.get_property_by_id(up.property_id)
                             if up_attr:
@@ -735,7 +734,7 @@ class KeysConstraintsHandlersMixin:
                     if up.primary_key_type == key_type_str:
                         up_attr = entity.get_property_by_id(up.property_id)
                         if up_attr and up_attr.name in key_columns_set:
-                            constraint.unique_properties.remove(up)
+                            self._remove_identical(constraint.unique_properties, up)
                             up_attr.is_key = False
                             # In Cassandra, the only way for a column to be
                             # non-null is to be part of the partition or
@@ -752,7 +751,7 @@ class KeysConstraintsHandlersMixin:
                     key_names_str = ", ".join(key_columns)
                     self.changes.append(f"{operation}_KEY:{entity_name}.({key_names_str})")
                     if not constraint.unique_properties:
-                        entity.constraints.remove(constraint)
+                        self._remove_identical(entity.constraints, constraint)
                     self._touch(entity_name)
                     return OperationResult.ok()
         return OperationResult.skipped("delete_key: precondition not met")
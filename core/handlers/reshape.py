@@ -2,21 +2,19 @@
 
 import copy
 import logging
-import uuid
 from typing import Dict
 
 from Schema.unified_meta_schema import (
     EntityType, EntityKind, Property,
     Reference, Embedded, Edge,
     PrimitiveDataType, PrimitiveType,
-    TYPE_STR_MAP,
+    TYPE_STR_MAP, new_meta_id,
 )
 from parser.params import (
-    OperationResult,
+    OpType, OperationResult,
     CastEntityParams,
     CastPropertyParams, MergeParams, SplitParams,
 )
-from parser.listeners import OpType
 from core.transformer import register_handler
 
 logger = logging.getLogger(__name__)
@@ -32,14 +30,14 @@ def _refresh_entity_ids(entity):
     the original entity and its clone."""
     prop_remap = {}
     for prop in entity.properties:
-        new_id = str(uuid.uuid4())
+        new_id = new_meta_id()
         prop_remap[prop.meta_id] = new_id
         prop.meta_id = new_id
     up_remap = {}
     for c in entity.constraints:
         if c.kind == "unique":
             for up in c.unique_properties:
-                new_up_id = str(uuid.uuid4())
+                new_up_id = new_meta_id()
                 up_remap[up.meta_id] = new_up_id
                 up.meta_id = new_up_id
                 if up.property_id in prop_remap:
@@ -303,7 +301,7 @@ class ReshapeHandlersMixin:
                         # Fresh UniqueProperty.meta_id to avoid UUID collision
                         # with the source's preserved PK (when source survives
                         # this SPLIT via in-place modification below).
-                        up.meta_id = str(uuid.uuid4())
+                        up.meta_id = new_meta_id()
                     new_entity.add_constraint(new_pk)
 
             self.database.add_entity_type(new_entity)
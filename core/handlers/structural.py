@@ -11,11 +11,10 @@ from Schema.unified_meta_schema import (
     PrimitiveDataType, PrimitiveType, ListDataType,
 )
 from parser.params import (
-    OperationResult,
+    OpType, OperationResult,
     NestParams, UnnestParams, FlattenParams, UnflattenParams,
     WindParams, UnwindParams,
 )
-from parser.listeners import OpType
 from core.transformer import register_handler
 
 logger = logging.getLogger(__name__)
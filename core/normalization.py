@@ -132,8 +132,11 @@ def normalize_property_psm(db: Database, source_type: str, target_type: str) ->
     # is more honest than silently rewriting the meta to hide the gap.
     for entity in db.entity_types.values():
         for prop in entity.properties:
-            if isinstance(prop.data_type, PrimitiveDataType):
-                prop.data_type.max_length = None
+            # Rebind rather than mutate: a PrimitiveDataType may be shared by
+            # several properties (Database.from_dict reuses identical ones).
+            dt = prop.data_type
+            if isinstance(dt, PrimitiveDataType) and dt.max_length is not None:
+                prop.data_type = PrimitiveDataType(dt.primitive_type, None, dt.precision, dt.scale)
 
 
 def normalize_document_cardinality(db: Database, source_type: str) -> None:
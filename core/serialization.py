@@ -13,6 +13,7 @@ from Schema.unified_meta_schema import (
     Reference,
     TypeMappings,
     UniqueConstraint,
+    enum_value,
 )
 from config import (
     SOURCE_TYPE_COLUMNAR,
@@ -25,7 +26,7 @@ from config import (
 def _get_type_str(data_type) -> str:
     """Convert a DataType (Primitive/List/Set/Map) to a short label string."""
     if hasattr(data_type, 'primitive_type'):
-        return data_type.primitive_type.value
+        return enum_value(data_type.primitive_type)
     elif hasattr(data_type, 'key_type'):
         # MapDataType — check before element_type since Map may also have element_type
         key = _get_type_str(data_type.key_type)
@@ -65,7 +66,7 @@ def _serialize_entity(name: str, entity, db: Optional[Database] = None) -> Dict[
             for up in c.unique_properties:
                 attr = entity.get_property_by_id(up.property_id)
                 pk_attr_names.append(attr.name if attr else up.property_id)
-                pk_types.append(up.primary_key_type.value)
+                pk_types.append(enum_value(up.primary_key_type))
             constraint_dict = {
                 "type": "PRIMARY_KEY" if c.is_primary_key else "UNIQUE",
                 "columns": pk_attr_names,
@@ -125,7 +126,7 @@ def _serialize_entity(name: str, entity, db: Optional[Database] = None) -> Dict[
             for up in c.unique_properties:
                 attr = entity.get_property_by_id(up.property_id)
                 attr_name = attr.name if attr else up.property_id
-                pk_val = up.primary_key_type.value
+                pk_val = enum_value(up.primary_key_type)
                 if pk_val != "simple":
                     pk_type_map[attr_name] = pk_val
 
@@ -141,16 +142,16 @@ def _serialize_entity(name: str, entity, db: Optional[Database] = None) -> Dict[
             attr_dict["key_type"] = pk_type_map[a.name]
         serialized_attrs.append(attr_dict)
 
-    return {
-        "name": name,
-        "entity_kind": entity.entity_kind.value,
-        "properties": serialized_attrs,
-        "constraints": constraints,
-        "references": [
-            {
+    # One pass over the relationships, bucketed by concrete class (Reference,
+    # Embedded and Edge have no subclasses).
+    references, embedded, edges = [], [], []
+    for r in entity.relationships:
+        rel_cls = type(r)
+        if rel_cls is Reference:
+            references.append({
                 "name": r.ref_name,
                 "target": r.get_target_entity_name(),
-                "target_end_cardinality": r.target_end_cardinality.value if hasattr(r, 'target_end_cardinality') else '1..1',
+                "target_end_cardinality": enum_value(r.target_end_cardinality) if hasattr(r, 'target_end_cardinality') else '1..1',
                 # ``is_enforced`` is emitted only when False (the non-default)
                 # so that the JSON for every existing enforced Reference stays
                 # byte-identical to the pre-feature serialization.
@@ -159,26 +160,29 @@ def _serialize_entity(name: str, entity, db: Optional[Database] = None) -> Dict[
                     {"name": a.name, "type": _get_type_str(a.data_type)}
                     for a in r.edge_properties
                 ]} if r.edge_properties else {})
-            }
-            for r in entity.relationships if isinstance(r, Reference)
-        ],
-        "embedded": [
-            {
+            })
+        elif rel_cls is Embedded:
+            embedded.append({
                 "name": r.aggr_name,
                 "target": r.get_target_entity_name(),
-                "target_end_cardinality": r.target_end_cardinality.value
-            }
-            for r in entity.relationships if isinstance(r, Embedded)
-        ],
-        "edges": [
-            {
+                "target_end_cardinality": enum_value(r.target_end_cardinality)
+            })
+        elif rel_cls is Edge:
+            edges.append({
                 "name": r.rel_type_name,
                 "target": r.get_target_entity_name(),
                 "source": r.source_entity,
-                "target_end_cardinality": r.target_end_cardinality.value
-            }
-            for r in entity.relationships if isinstance(r, Edge)
-        ],
+                "target_end_cardinality": enum_value(r.target_end_cardinality)
+            })
+
+    return {
+        "name": name,
+        "entity_kind": enum_value(entity.entity_kind),
+        "properties": serialized_attrs,
+        "constraints": constraints,
+        "references": references,
+        "embedded": embedded,
+        "edges": edges,
         "labels": getattr(entity, 'labels', [])
     }
 
@@ -197,10 +201,10 @@ def _serialize_relationship_types(db: Database) -> Dict[str, Any]:
                 {"name": a.name, "type": _get_type_str(a.data_type)}
                 for a in e.properties
             ],
-            "target_end_cardinality": (e.edge_target_end_cardinality or Cardinality.ZERO_TO_MANY).value
+            "target_end_cardinality": enum_value(e.edge_target_end_cardinality or Cardinality.ZERO_TO_MANY)
         }
         if e.edge_source_end_cardinality is not None:
-            d["source_end_cardinality"] = e.edge_source_end_cardinality.value
+            d["source_end_cardinality"] = enum_value(e.edge_source_end_cardinality)
         result[name] = d
     return result
 
@@ -221,7 +225,7 @@ def db_to_dict(db: Database) -> Dict[str, Any]:
 
     result["__db_meta__"] = {
         "db_name": db.db_name,
-        "db_type": db.db_type.value,
+        "db_type": enum_value(db.db_type),
     }
 
     return result
@@ -297,7 +301,7 @@ def db_to_source_dict(db: Database, source_type: str) -> Dict[str, Any]:
 
     entities["__db_meta__"] = {
         "db_name": db.db_name,
-        "db_type": db.db_type.value,
+        "db_type": enum_value(db.db_type),
     }
 
     return entities
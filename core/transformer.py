@@ -72,6 +72,21 @@ class SchemaTransformerBase:
             if n and n not in self._touched:
                 self._touched.append(n)
 
+    @staticmethod
+    def _remove_identical(items: list, obj: Any) -> None:
+        """Remove ``obj`` itself from ``items``.
+
+        ``list.remove`` finds its target with ``==``, which on the meta-model
+        dataclasses compares every field, recursing into data types and
+        member lists, for each element it passes. Handlers always hold the
+        exact object they want gone, so an identity scan suffices.
+        """
+        for i, item in enumerate(items):
+            if item is obj:
+                del items[i]
+                return
+        raise ValueError("object not in list")
+
     def _remember_relationship_trace(
         self, holder: str, ref_name: str, target: str,
         target_end_cardinality: Cardinality,
@@ -137,7 +152,7 @@ class SchemaTransformerBase:
                 )
                 return None, None
             t = same_dir[0]
-            self._relationship_trace.remove(t)
+            self._remove_identical(self._relationship_trace, t)
             return t.target_end_cardinality, t.source_end_cardinality
 
         # Non-self-ref: both directions matching is genuinely ambiguous.
@@ -158,7 +173,7 @@ class SchemaTransformerBase:
                 )
                 return None, None
             t = same_dir[0]
-            self._relationship_trace.remove(t)
+            self._remove_identical(self._relationship_trace, t)
             return t.target_end_cardinality, t.source_end_cardinality
 
         if opp_dir:
@@ -170,7 +185,7 @@ class SchemaTransformerBase:
                 )
                 return None, None
             t = opp_dir[0]
-            self._relationship_trace.remove(t)
+            self._remove_identical(self._relationship_trace, t)
             # FK direction reversed: swap the trace's two ends —
             # trace.target_end_cardinality (per trace-source, how many targets)
             # becomes the Edge's source_end_cardinality, and vice versa.
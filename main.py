@@ -57,23 +57,25 @@ def print_schema_comparison(result):
                         new_entities.add(name)
 
     total_width = col_width * 2 + 3
-    print("\n" + "=" * total_width)
-    print(f"{BOLD} SCHEMA TRANSFORMATION: {source_type} -> {target_type}{RESET}")
-    print("=" * total_width)
-
-    print(f"\n  {GREEN}{BOLD}[EMBED]{RESET} = Embedded   {CYAN}[REF]{RESET} = Reference/FK")
-    print()
+    rule = "-" * total_width
+    # The whole table is collected and written with a single print.
+    out = [
+        "\n" + "=" * total_width,
+        f"{BOLD} SCHEMA TRANSFORMATION: {source_type} -> {target_type}{RESET}",
+        "=" * total_width,
+        f"\n  {GREEN}{BOLD}[EMBED]{RESET} = Embedded   {CYAN}[REF]{RESET} = Reference/FK",
+        "",
+    ]
 
     headers = ["Meta V1 (Source)", "Meta V2 (Result)"]
-    print("-" * total_width)
-    print(" | ".join(h.center(col_width) for h in headers))
-    print("-" * total_width)
-
-    all_entities = set(
-        k for k in list(meta_v1.keys()) + list(meta_v2.keys())
-        if not k.startswith('__')
-    )
-    for entity_name in sorted(all_entities):
+    out.append(rule)
+    out.append(" | ".join(h.center(col_width) for h in headers))
+    out.append(rule)
+
+    # Union of both key views directly, without concatenating copied lists.
+    entity_names = sorted(k for k in meta_v1.keys() | meta_v2.keys() if not k.startswith('__'))
+    blank = " " * col_width
+    for entity_name in entity_names:
         columns = []
         max_lines = 0
 
@@ -108,13 +110,13 @@ def print_schema_comparison(result):
             columns.append(lines)
             max_lines = max(max_lines, len(lines))
 
-        for col_lines in columns:
-            while len(col_lines) < max_lines:
-                col_lines.append(" " * col_width)
+        left, right = columns
+        left.extend([blank] * (max_lines - len(left)))
+        right.extend([blank] * (max_lines - len(right)))
+        out.extend(f"{l} | {r}" for l, r in zip(left, right))
+        out.append(rule)
 
-        for row in range(max_lines):
-            print(" | ".join(columns[j][row] for j in range(2)))
-        print("-" * total_width)
+    print("\n".join(out))
 
 
 def print_exported_target(result):
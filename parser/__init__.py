@@ -1,14 +1,31 @@
-"""SMILE parser package — ANTLR listeners, parser factory, op param dataclasses."""
-from parser.factory import (
-    parse_smile_auto,
-    get_grammar_info,
-    get_parser_components,
-    SyntaxErrorListener,
-)
-from parser.listeners import (
-    SMILESpecificListener,
-    SMILEGeneralizedListener,
-    MigrationContext,
-    Operation,
-    OpType,
-)
+"""SMILE parser package — ANTLR listeners, parser factory, tree walker, op param dataclasses.
+
+The re-exports below resolve on first access. Importing a light submodule
+such as ``parser.params`` (as the transformer handlers do) must not load the
+generated ANTLR lexers and parsers, which deserialise their ATNs at import.
+"""
+import importlib
+
+_EXPORTS = {
+    'parse_smile_auto': 'parser.factory',
+    'get_grammar_info': 'parser.factory',
+    'get_parser_components': 'parser.factory',
+    'SyntaxErrorListener': 'parser.factory',
+    'SMILESpecificListener': 'parser.listeners',
+    'SMILEGeneralizedListener': 'parser.listeners',
+    'MigrationContext': 'parser.params',
+    'Operation': 'parser.params',
+    'OpType': 'parser.params',
+    'walk': 'parser.walker',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
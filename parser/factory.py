@@ -1,11 +1,14 @@
 """Parser Factory - Auto-select parser based on file extension"""
+import copy
+import hashlib
 import sys
+import threading
 from pathlib import Path
 from typing import Tuple, List
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from antlr4 import FileStream, CommonTokenStream, ParseTreeWalker
+from antlr4 import InputStream, CommonTokenStream
 from antlr4.error.ErrorListener import ErrorListener
 
 # Import both grammars
@@ -19,6 +22,14 @@ from grammar.generalized.SMILE_GeneralizedListener import SMILE_GeneralizedListe
 
 # Import custom listeners
 from parser.listeners import SMILESpecificListener, SMILEGeneralizedListener
+from parser.walker import walk
+
+# (grammar type, script digest) -> (context, operations, errors) of a parse.
+# The web server re-runs the same canned scripts on every request; a hit
+# skips the ANTLR lexer/parser and costs a deepcopy of the results instead.
+_PARSE_CACHE = {}
+_PARSE_CACHE_SIZE = 32
+_PARSE_CACHE_LOCK = threading.Lock()  # ThreadingHTTPServer parses concurrently
 
 
 class SyntaxErrorListener(ErrorListener):
@@ -71,8 +82,9 @@ def parse_smile_file(file_path: str, listener_class):
             f"Listener class must inherit from {BaseListenerClass.__name__} for {grammar_type} grammar"
         )
 
-    # Create input stream
-    input_stream = FileStream(file_path, encoding='utf-8')
+    # Create input stream (one read and decode, as in parse_smile_auto)
+    with open(file_path, 'rb') as f:
+        input_stream = InputStream(f.read().decode('utf-8'))
 
     # Create lexer
     lexer = LexerClass(input_stream)
@@ -95,8 +107,7 @@ def parse_smile_file(file_path: str, listener_class):
 
     # Walk parse tree with listener
     listener = listener_class()
-    walker = ParseTreeWalker()
-    walker.walk(listener, tree)
+    walk(listener, tree)
 
     return listener, error_listener.errors
 
@@ -131,8 +142,17 @@ def parse_smile_auto(file_path: str):
     else:
         raise ValueError(f"Unknown grammar type: {grammar_type}. Expected 'specific' or 'generalized'")
 
+    # Results are cached on the script's content, so an edited file is
+    # re-parsed; callers get their own copies to mutate.
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    key = (grammar_type, hashlib.blake2b(raw, digest_size=16).digest())
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     # Create input stream
-    input_stream = FileStream(file_path, encoding='utf-8')
+    input_stream = InputStream(raw.decode('utf-8'))
 
     # Create lexer
     lexer = LexerClass(input_stream)
@@ -155,7 +175,12 @@ def parse_smile_auto(file_path: str):
 
     # Walk parse tree with listener
     listener = ListenerClass()
-    walker = ParseTreeWalker()
-    walker.walk(listener, tree)
-
-    return listener.context, listener.operations, error_listener.errors
+    walk(listener, tree)
+
+    result = (listener.context, listener.operations, error_listener.errors)
+    snapshot = copy.deepcopy(result)
+    with _PARSE_CACHE_LOCK:
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[key] = snapshot
+    return result
@@ -1,18 +1,19 @@
 """SMILE Listeners - Parsers for the two SMILE grammar variants."""
 import sys
-from enum import Enum
 from pathlib import Path
-from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from antlr4.tree.Tree import ParseTreeListener
+
 from grammar.specific.SMILE_SpecificListener import SMILE_SpecificListener
 from grammar.specific.SMILE_SpecificParser import SMILE_SpecificParser
 from grammar.generalized.SMILE_GeneralizedListener import SMILE_GeneralizedListener
 from grammar.generalized.SMILE_GeneralizedParser import SMILE_GeneralizedParser
 from parser.params import (
-    OpParams, KeyType,
+    OpType, MigrationContext, Operation,
+    KeyType,
     NestParams, UnnestParams, FlattenParams, UnflattenParams,
     WindParams, UnwindParams,
     AddEntityParams, DeleteEntityParams, RenameEntityParams, CopyEntityParams,
@@ -33,77 +34,23 @@ from Schema.unified_meta_schema import (
 )
 
 
-class OpType(str, Enum):
-    """Operation types for SMILE schema migration operations."""
-    # Structure operations
-    NEST = "nest"
-    UNNEST = "unnest"
-    FLATTEN = "flatten"
-    UNFLATTEN = "unflatten"
-    WIND = "wind"
-    UNWIND = "unwind"
-    # Entity operations
-    ADD_ENTITY = "add_entity"
-    DELETE_ENTITY = "delete_entity"
-    RENAME_ENTITY = "rename_entity"
-    COPY_ENTITY = "copy_entity"
-    # Property operations
-    ADD_PROPERTY = "add_property"
-    DELETE_PROPERTY = "delete_property"
-    RENAME_PROPERTY = "rename_property"
-    COPY_PROPERTY = "copy_property"
-    MOVE_PROPERTY = "move_property"
-    # Key/Constraint operations
-    ADD_KEY = "add_key"
-    DELETE_KEY = "delete_key"
-    ADD_FOREIGN_KEY = "add_foreign_key"
-    DELETE_FOREIGN_KEY = "delete_foreign_key"
-    CAST_CONSTRAINT = "cast_constraint"
-    # ADD_CONSTRAINT / DELETE_CONSTRAINT cover constraint kinds the narrow
-    # operators above don't address: logical references (Mongo cross-collection,
-    # Cass denormalised columns, PG soft references), CHECK predicates, and
-    # post-hoc EXISTENCE (NOT NULL applied after property creation).
-    ADD_CONSTRAINT = "add_constraint"
-    DELETE_CONSTRAINT = "delete_constraint"
-    CAST_ENTITY = "cast_entity"
-    # Embedded operations
-    ADD_EMBEDDED = "add_embedded"
-    DELETE_EMBEDDED = "delete_embedded"
-    # Label operations (Graph)
-    ADD_LABEL = "add_label"
-    DELETE_LABEL = "delete_label"
-    # Schema transformation
-    TRANSFORM = "transform"
-    MERGE = "merge"
-    SPLIT = "split"
-    CAST_PROPERTY = "cast_property"
-    RECARD = "recard"
-
-
-@dataclass
-class MigrationContext:
-    """Context information from SMILE script declaration."""
-    name: str = ""
-    version: str = ""
-    is_evolution: bool = False
-    source_db_type: str = ""
-    target_db_type: str = ""
-    schema_name: str = ""
-    schema_version: str = ""
-    target_schema_version: str = ""  # only for evolution: VERSION x TO y
-
-
-@dataclass
-class Operation:
-    """Represents a single SMILE operation."""
-    op_type: OpType
-    params: OpParams  # typed payload; see operation_params.py for one dataclass per OpType
-    original_keyword: str = ""  # Original keyword from source (e.g., "FLATTEN", "RENAME_PROPERTY")
-
-
 class BaseSMILEListener:
     """Base class with shared parsing logic for all SMILE variants."""
 
+    def __init_subclass__(cls, **kwargs):
+        """Reject ``enter*`` / ``exit*`` methods that match no hook of the
+        generated listener: nothing would ever call them, so a misspelt rule
+        name would otherwise just drop that operation from every parse."""
+        super().__init_subclass__(**kwargs)
+        generated = next((k for k in cls.__mro__ if ParseTreeListener in k.__bases__), None)
+        if generated is None:
+            return
+        for name in vars(cls):
+            if name.startswith(('enter', 'exit')) and not hasattr(generated, name):
+                raise TypeError(
+                    f"{cls.__name__}.{name} does not match any {generated.__name__} hook"
+                )
+
     def __init__(self):
         self.context = MigrationContext()
         self.operations: List[Operation] = []
@@ -127,15 +74,25 @@ class BaseSMILEListener:
                 pairs.extend(self._parse_condition_pairs(sub))
         return pairs
 
+    @staticmethod
+    def _clause_alternative(clause):
+        """The sub-rule context a ``*Clause`` rule wraps (``propertyClause:
+        withTypeClause | withDefaultClause | notNullClause``) and its context
+        class name. Reading the one child replaces probing each alternative
+        accessor in turn, which rescans the clause's children every time."""
+        inner = clause.getChild(0)
+        return inner, type(inner).__name__
+
     def _parse_property_clauses(self, clause_list):
         """Parse property clauses: WITH TYPE, WITH DEFAULT, NOT NULL."""
         result = []
         for clause in clause_list:
-            if hasattr(clause, 'withTypeClause') and clause.withTypeClause():
-                result.append({'type': 'TYPE', 'data_type': clause.withTypeClause().dataType().getText()})
-            elif hasattr(clause, 'withDefaultClause') and clause.withDefaultClause():
-                result.append({'type': 'DEFAULT', 'value': clause.withDefaultClause().literal().getText()})
-            elif hasattr(clause, 'notNullClause') and clause.notNullClause():
+            inner, kind = self._clause_alternative(clause)
+            if kind == 'WithTypeClauseContext':
+                result.append({'type': 'TYPE', 'data_type': inner.dataType().getText()})
+            elif kind == 'WithDefaultClauseContext':
+                result.append({'type': 'DEFAULT', 'value': inner.literal().getText()})
+            elif kind == 'NotNullClauseContext':
                 result.append({'type': 'NOT_NULL'})
         return result
 
@@ -143,22 +100,24 @@ class BaseSMILEListener:
         """Parse reference clauses"""
         result = {}
         for clause in clause_list:
-            if hasattr(clause, 'withCardinalityClause') and clause.withCardinalityClause():
-                result['cardinality'] = clause.withCardinalityClause().cardinalityType().getText()
-            elif hasattr(clause, 'usingKeyClause') and clause.usingKeyClause():
-                result['key'] = clause.usingKeyClause().identifier().getText()
-            elif hasattr(clause, 'whereClause') and clause.whereClause():
-                result['where'] = clause.whereClause().condition().getText()
+            inner, kind = self._clause_alternative(clause)
+            if kind == 'WithCardinalityClauseContext':
+                result['cardinality'] = inner.cardinalityType().getText()
+            elif kind == 'UsingKeyClauseContext':
+                result['key'] = inner.identifier().getText()
+            elif kind == 'WhereClauseContext':
+                result['where'] = inner.condition().getText()
         return result
 
     def _parse_embedded_clauses(self, clause_list):
         """Parse embedded clauses."""
         result = []
         for clause in clause_list:
-            if hasattr(clause, 'withCardinalityClause') and clause.withCardinalityClause():
-                result.append({'type': 'CARDINALITY', 'value': clause.withCardinalityClause().cardinalityType().getText()})
-            elif hasattr(clause, 'withStructureClause') and clause.withStructureClause():
-                ids = clause.withStructureClause().identifierList()
+            inner, kind = self._clause_alternative(clause)
+            if kind == 'WithCardinalityClauseContext':
+                result.append({'type': 'CARDINALITY', 'value': inner.cardinalityType().getText()})
+            elif kind == 'WithStructureClauseContext':
+                ids = inner.identifierList()
                 result.append({'type': 'STRUCTURE', 'fields': [id.getText() for id in ids.identifier()]})
         return result
 
@@ -166,8 +125,9 @@ class BaseSMILEListener:
         """Parse entity clauses."""
         result = []
         for clause in clause_list:
-            if hasattr(clause, 'withPropertiesClause') and clause.withPropertiesClause():
-                prop_def_list = clause.withPropertiesClause().propertyDefList()
+            inner, kind = self._clause_alternative(clause)
+            if kind == 'WithPropertiesClauseContext':
+                prop_def_list = inner.propertyDefList()
                 props = []
                 for prop_def in prop_def_list.propertyDef():
                     props.append({
@@ -175,8 +135,8 @@ class BaseSMILEListener:
                         'data_type': prop_def.dataType().getText()
                     })
                 result.append({'type': 'PROPERTIES', 'properties': props})
-            elif hasattr(clause, 'withKeyClause') and clause.withKeyClause():
-                result.append({'type': 'KEY', 'key_name': clause.withKeyClause().identifier().getText()})
+            elif kind == 'WithKeyClauseContext':
+                result.append({'type': 'KEY', 'key_name': inner.identifier().getText()})
         return result
 
     def _parse_key_columns(self, key_columns_ctx):
@@ -202,14 +162,15 @@ class BaseSMILEListener:
         """Parse key clauses"""
         result = {}
         for clause in clause_list:
-            if hasattr(clause, 'referencesClause') and clause.referencesClause():
-                ref = clause.referencesClause()
+            inner, kind = self._clause_alternative(clause)
+            if kind == 'ReferencesClauseContext':
+                ref = inner
                 result['references'] = {
                     'table': ref.qualifiedName().getText(),
                     'columns': [id.getText() for id in ref.identifierList().identifier()]
                 }
-            elif hasattr(clause, 'withColumnsClause') and clause.withColumnsClause():
-                ids = clause.withColumnsClause().identifierList()
+            elif kind == 'WithColumnsClauseContext':
+                ids = inner.identifierList()
                 result['columns'] = [id.getText() for id in ids.identifier()]
         return result
 
@@ -279,14 +240,16 @@ class BaseSMILEListener:
         if cls_name == "CheckNotExprContext":
             return CheckNot(expr=self._build_check_expr(ctx.checkExpr()))
         if cls_name == "CheckAndExprContext":
+            left, right = ctx.checkExpr()
             return CheckAnd(
-                left=self._build_check_expr(ctx.checkExpr(0)),
-                right=self._build_check_expr(ctx.checkExpr(1)),
+                left=self._build_check_expr(left),
+                right=self._build_check_expr(right),
             )
         if cls_name == "CheckOrExprContext":
+            left, right = ctx.checkExpr()
             return CheckOr(
-                left=self._build_check_expr(ctx.checkExpr(0)),
-                right=self._build_check_expr(ctx.checkExpr(1)),
+                left=self._build_check_expr(left),
+                right=self._build_check_expr(right),
             )
         if cls_name == "CheckRawExprContext":
             return CheckRaw(raw_text=self._strip_string_literal(
@@ -386,13 +349,15 @@ class SMILESpecificListener(SMILE_SpecificListener, BaseSMILEListener):
 
     def enterUsingDecl(self, ctx):
         self.context.schema_name = ctx.identifier().getText()
-        self.context.schema_version = ctx.version(0).getText()
-        if len(ctx.version()) > 1:
-            self.context.target_schema_version = ctx.version(1).getText()
+        versions = ctx.version()
+        self.context.schema_version = versions[0].getText()
+        if len(versions) > 1:
+            self.context.target_schema_version = versions[1].getText()
 
     def enterFromToDecl(self, ctx):
-        self.context.source_db_type = ctx.databaseType(0).getText()
-        self.context.target_db_type = ctx.databaseType(1).getText()
+        source_db, target_db = ctx.databaseType()
+        self.context.source_db_type = source_db.getText()
+        self.context.target_db_type = target_db.getText()
 
     # Structure operations
     def enterFlatten(self, ctx):
@@ -449,8 +414,9 @@ class SMILESpecificListener(SMILE_SpecificListener, BaseSMILEListener):
         # Syntax: NEST qualifiedName COLON unnestFieldList IN qualifiedName WHERE condition
         # Source now accepts qualifiedName too — supports nesting an embedded entity
         # like orders.customer into another container.
-        source_entity = ctx.qualifiedName(0).getText()      # address OR orders.customer
-        target_location = ctx.qualifiedName(1).getText()    # customers.address
+        source_ctx, target_ctx = ctx.qualifiedName()
+        source_entity = source_ctx.getText()      # address OR orders.customer
+        target_location = target_ctx.getText()    # customers.address
 
         # Parse WHERE condition(s): supports single or AND-chained conditions
         join_conditions = self._parse_condition_pairs(ctx.condition())
@@ -911,13 +877,15 @@ class SMILEGeneralizedListener(SMILE_GeneralizedListener, BaseSMILEListener):
 
     def enterUsingDecl(self, ctx):
         self.context.schema_name = ctx.identifier().getText()
-        self.context.schema_version = ctx.version(0).getText()
-        if len(ctx.version()) > 1:
-            self.context.target_schema_version = ctx.version(1).getText()
+        versions = ctx.version()
+        self.context.schema_version = versions[0].getText()
+        if len(versions) > 1:
+            self.context.target_schema_version = versions[1].getText()
 
     def enterFromToDecl(self, ctx):
-        self.context.source_db_type = ctx.databaseType(0).getText()
-        self.context.target_db_type = ctx.databaseType(1).getText()
+        source_db, target_db = ctx.databaseType()
+        self.context.source_db_type = source_db.getText()
+        self.context.target_db_type = target_db.getText()
 
     # Structure operations
     def enterFlatten_gen(self, ctx):
@@ -970,8 +938,9 @@ class SMILEGeneralizedListener(SMILE_GeneralizedListener, BaseSMILEListener):
 
     def enterNest_gen(self, ctx):
         # Rule: NEST qualifiedName COLON unnestFieldList IN qualifiedName WHERE condition
-        source_entity = ctx.qualifiedName(0).getText()      # address OR orders.customer
-        target_location = ctx.qualifiedName(1).getText()    # customers.address
+        source_ctx, target_ctx = ctx.qualifiedName()
+        source_entity = source_ctx.getText()      # address OR orders.customer
+        target_location = target_ctx.getText()    # customers.address
 
         # Parse WHERE condition(s): supports single or AND-chained conditions
         join_conditions = self._parse_condition_pairs(ctx.condition())
@@ -15,6 +15,53 @@ class KeyType(str, Enum):
     CLUSTERING = "CLUSTERING"
 
 
+class OpType(str, Enum):
+    """Operation types for SMILE schema migration operations."""
+    # Structure operations
+    NEST = "nest"
+    UNNEST = "unnest"
+    FLATTEN = "flatten"
+    UNFLATTEN = "unflatten"
+    WIND = "wind"
+    UNWIND = "unwind"
+    # Entity operations
+    ADD_ENTITY = "add_entity"
+    DELETE_ENTITY = "delete_entity"
+    RENAME_ENTITY = "rename_entity"
+    COPY_ENTITY = "copy_entity"
+    # Property operations
+    ADD_PROPERTY = "add_property"
+    DELETE_PROPERTY = "delete_property"
+    RENAME_PROPERTY = "rename_property"
+    COPY_PROPERTY = "copy_property"
+    MOVE_PROPERTY = "move_property"
+    # Key/Constraint operations
+    ADD_KEY = "add_key"
+    DELETE_KEY = "delete_key"
+    ADD_FOREIGN_KEY = "add_foreign_key"
+    DELETE_FOREIGN_KEY = "delete_foreign_key"
+    CAST_CONSTRAINT = "cast_constraint"
+    # ADD_CONSTRAINT / DELETE_CONSTRAINT cover constraint kinds the narrow
+    # operators above don't address: logical references (Mongo cross-collection,
+    # Cass denormalised columns, PG soft references), CHECK predicates, and
+    # post-hoc EXISTENCE (NOT NULL applied after property creation).
+    ADD_CONSTRAINT = "add_constraint"
+    DELETE_CONSTRAINT = "delete_constraint"
+    CAST_ENTITY = "cast_entity"
+    # Embedded operations
+    ADD_EMBEDDED = "add_embedded"
+    DELETE_EMBEDDED = "delete_embedded"
+    # Label operations (Graph)
+    ADD_LABEL = "add_label"
+    DELETE_LABEL = "delete_label"
+    # Schema transformation
+    TRANSFORM = "transform"
+    MERGE = "merge"
+    SPLIT = "split"
+    CAST_PROPERTY = "cast_property"
+    RECARD = "recard"
+
+
 # Operation result
 
 @dataclass
@@ -444,3 +491,26 @@ OpParams = Union[
     CastPropertyParams, MergeParams, SplitParams,
     RecardParams, TransformParams,
 ]
+
+
+# Parse results
+
+@dataclass
+class MigrationContext:
+    """Context information from SMILE script declaration."""
+    name: str = ""
+    version: str = ""
+    is_evolution: bool = False
+    source_db_type: str = ""
+    target_db_type: str = ""
+    schema_name: str = ""
+    schema_version: str = ""
+    target_schema_version: str = ""  # only for evolution: VERSION x TO y
+
+
+@dataclass
+class Operation:
+    """Represents a single SMILE operation."""
+    op_type: OpType
+    params: OpParams  # typed payload; see operation_params.py for one dataclass per OpType
+    original_keyword: str = ""  # Original keyword from source (e.g., "FLATTEN", "RENAME_PROPERTY")
@@ -0,0 +1,184 @@
+"""Selective parse-tree walker for the SMILE listeners.
+
+ANTLR's ``ParseTreeWalker`` recurses over every node and, per rule node,
+calls ``enterEveryRule``, the context's ``enterRule`` (a ``hasattr`` probe
+plus a call into the listener) and the mirror-image exit pair. The generated
+listener bases only hold no-op hooks and the SMILE listeners override a few
+dozen ``enter*`` methods, so almost all of those calls do nothing.
+
+``walk`` resolves once per (listener class, context class) which hooks the
+listener really overrides and calls only those, from an explicit stack. It
+also skips whole subtrees whose rule cannot, per the grammar's ATN, contain
+any rule the listener hooks (identifiers, literals, data types, ...).
+"""
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from antlr4 import ParseTreeWalker
+from antlr4.atn.ATNState import RuleStopState
+from antlr4.atn.Transition import RuleTransition
+from antlr4.tree.Tree import ParseTreeListener
+
+# Listener-wide hooks the selective walk does not dispatch; a listener that
+# overrides any of them is walked by ANTLR's own walker instead.
+_GENERIC_HOOKS = ("enterEveryRule", "exitEveryRule", "visitTerminal", "visitErrorNode")
+
+# (enter hook, exit hook, descend) for one context class; hooks are None when
+# not overridden, ``descend`` is False when no hooked rule can occur below.
+_Hooks = Tuple[Optional[Callable], Optional[Callable], bool]
+
+# listener class -> {node class -> hooks}. Terminal nodes map to None.
+_HOOK_TABLES: Dict[type, Dict[type, Optional[_Hooks]]] = {}
+
+# parser class -> rule index -> rule indices that can occur below that rule.
+_DESCENDANT_RULES: Dict[type, List[FrozenSet[int]]] = {}
+
+# (listener class, parser class) -> rule indices with an overridden hook.
+_HOOKED_RULES: Dict[Tuple[type, type], FrozenSet[int]] = {}
+
+
+def _generated_base(listener_cls: type) -> type:
+    """The ANTLR-generated listener in ``listener_cls``'s MRO: the class that
+    derives directly from ``ParseTreeListener`` and holds the no-op hooks."""
+    for klass in listener_cls.__mro__:
+        if ParseTreeListener in klass.__bases__:
+            return klass
+    return ParseTreeListener
+
+
+def _override(listener_cls: type, base: type, name: str) -> Optional[Callable]:
+    """``listener_cls.<name>`` if it differs from the generated no-op, else None."""
+    fn = getattr(listener_cls, name, None)
+    if fn is None or fn is getattr(base, name, None):
+        return None
+    return fn
+
+
+def _descendant_rules(parser_cls: type) -> List[FrozenSet[int]]:
+    """Per rule, every rule reachable from it through rule invocations in the ATN."""
+    table = _DESCENDANT_RULES.get(parser_cls)
+    if table is not None:
+        return table
+    atn = parser_cls.atn
+    # Direct callees: scan each rule's states, stepping over (not into) calls
+    # and stopping at the stop state, whose edges lead back into the callers.
+    callees = []
+    for start in atn.ruleToStartState:
+        called = set()
+        seen = {start.stateNumber}
+        todo = [start]
+        while todo:
+            for t in todo.pop().transitions:
+                if isinstance(t, RuleTransition):
+                    called.add(t.target.ruleIndex)
+                    nxt = t.followState
+                else:
+                    nxt = t.target
+                if nxt.stateNumber not in seen and not isinstance(nxt, RuleStopState):
+                    seen.add(nxt.stateNumber)
+                    todo.append(nxt)
+        callees.append(called)
+    table = []
+    for rule in range(len(callees)):
+        reach = set()
+        todo = list(callees[rule])
+        while todo:
+            r = todo.pop()
+            if r not in reach:
+                reach.add(r)
+                todo.extend(callees[r])
+        table.append(frozenset(reach))
+    _DESCENDANT_RULES[parser_cls] = table
+    return table
+
+
+def _rule_index(parser_cls: type, ctx_cls: type) -> Optional[int]:
+    """Rule index of a generated context class. Labelled alternatives
+    (``# label`` in the grammar) subclass their rule's context, so the first
+    class in the MRO named after a rule decides."""
+    for klass in ctx_cls.__mro__:
+        rule = klass.__name__[:-len("Context")]
+        try:
+            return parser_cls.ruleNames.index(rule[:1].lower() + rule[1:])
+        except ValueError:
+            continue
+    return None
+
+
+def _hooked_rules(listener_cls: type, base: type, parser_cls: type) -> FrozenSet[int]:
+    key = (listener_cls, parser_cls)
+    rules = _HOOKED_RULES.get(key)
+    if rules is None:
+        found = set()
+        for name in dir(listener_cls):
+            if name.startswith("enter"):
+                rule = name[len("enter"):]
+            elif name.startswith("exit"):
+                rule = name[len("exit"):]
+            else:
+                continue
+            ctx_cls = getattr(parser_cls, rule + "Context", None)
+            if ctx_cls is not None and _override(listener_cls, base, name) is not None:
+                index = _rule_index(parser_cls, ctx_cls)
+                if index is not None:
+                    found.add(index)
+        rules = _HOOKED_RULES[key] = frozenset(found)
+    return rules
+
+
+def _resolve_hooks(listener_cls: type, base: type, node) -> Optional[_Hooks]:
+    # Generated contexts are named ``<Rule>Context`` and their enterRule /
+    # exitRule call ``enter<Rule>`` / ``exit<Rule>`` on the listener.
+    name = type(node).__name__
+    if not name.endswith("Context"):
+        return None
+    rule = name[:-len("Context")]
+    descend = True
+    parser = getattr(node, "parser", None)
+    if parser is not None:
+        parser_cls = type(parser)
+        below = _descendant_rules(parser_cls)[node.getRuleIndex()]
+        descend = not below.isdisjoint(_hooked_rules(listener_cls, base, parser_cls))
+    return (_override(listener_cls, base, "enter" + rule),
+            _override(listener_cls, base, "exit" + rule),
+            descend)
+
+
+def walk(listener: ParseTreeListener, tree) -> None:
+    """Walk ``tree`` depth-first, calling ``listener``'s overridden
+    ``enter<Rule>`` / ``exit<Rule>`` hooks in ``ParseTreeWalker`` order.
+    Subtrees that cannot contain a hooked rule are not entered."""
+    listener_cls = type(listener)
+    table = _HOOK_TABLES.get(listener_cls)
+    if table is None:
+        if any(_override(listener_cls, ParseTreeListener, n) for n in _GENERIC_HOOKS):
+            ParseTreeWalker.DEFAULT.walk(listener, tree)
+            return
+        table = _HOOK_TABLES[listener_cls] = {}
+    base = _generated_base(listener_cls)
+
+    # Pending exits are pushed as (exit hook, ctx) tuples between the nodes.
+    stack = [tree]
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    while stack:
+        node = pop()
+        node_cls = type(node)
+        if node_cls is tuple:
+            node[0](listener, node[1])
+            continue
+        try:
+            hooks = table[node_cls]
+        except KeyError:
+            hooks = table[node_cls] = _resolve_hooks(listener_cls, base, node)
+        if hooks is None:
+            continue
+        enter, exit_, descend = hooks
+        if enter is not None:
+            enter(listener, node)
+        if exit_ is not None:
+            push((exit_, node))
+        if descend:
+            children = node.children
+            if children:
+                extend(reversed(children))
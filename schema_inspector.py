@@ -1,12 +1,13 @@
 """Schema Inspector — Reverse Engineering interface for SMILE."""
+import io
 import sys
 import json
-import argparse
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from Schema.adapters import ADAPTER_REGISTRY
+from Schema.unified_meta_schema import enum_value
 from config import (
     SOURCE_TYPE_RELATIONAL, SOURCE_TYPE_DOCUMENT,
     SOURCE_TYPE_GRAPH, SOURCE_TYPE_COLUMNAR,
@@ -73,6 +74,10 @@ def _build_summary(db) -> dict:
         key_count = sum(1 for a in entity.properties if a.is_key)
         constraint_count = len(entity.constraints) if hasattr(entity, 'constraints') else 0
         rel_count = len(entity.relationships) if hasattr(entity, 'relationships') else 0
+        try:
+            kind = enum_value(entity.entity_kind)
+        except KeyError:
+            kind = str(entity.entity_kind)
 
         total_attrs += attr_count
         total_keys += key_count
@@ -81,7 +86,7 @@ def _build_summary(db) -> dict:
 
         entities.append({
             "name": name,
-            "entity_kind": str(entity.entity_kind.value) if hasattr(entity.entity_kind, 'value') else str(entity.entity_kind),
+            "entity_kind": kind,
             "properties": attr_count,
             "keys": key_count,
             "constraints": constraint_count,
@@ -149,6 +154,10 @@ def inspect_schema(source: str, db_type: str, input_mode: str = "file",
 
 def main():
     """CLI entry point."""
+    # Imported here: web_server imports this module for inspect_schema and
+    # never builds the CLI parser.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Schema Inspector — Reverse Engineer a schema into Meta Schema V1 (M-Model)"
     )
@@ -193,23 +202,25 @@ def main():
         sys.exit(1)
 
     if args.summary_only:
-        print(f"\n{'='*60}")
-        print(f"Schema Inspector — {result['db_type_display']}")
-        print(f"{'='*60}")
+        # Formatted into one buffer and written with a single write().
         summary = result["summary"]
-        print(f"\nEntities: {summary['entity_count']}")
-        print(f"Properties: {summary['property_count']}")
-        print(f"Keys: {summary['key_count']}")
-        print(f"Constraints: {summary['constraint_count']}")
-        print(f"Relationships: {summary['relationship_count']}")
-        print(f"Relationship Types: {summary['relationship_type_count']}")
-        print(f"\n--- Entities ---")
+        buf = io.StringIO()
+        buf.write(f"\n{'='*60}\n"
+                  f"Schema Inspector — {result['db_type_display']}\n"
+                  f"{'='*60}\n"
+                  f"\nEntities: {summary['entity_count']}\n"
+                  f"Properties: {summary['property_count']}\n"
+                  f"Keys: {summary['key_count']}\n"
+                  f"Constraints: {summary['constraint_count']}\n"
+                  f"Relationships: {summary['relationship_count']}\n"
+                  f"Relationship Types: {summary['relationship_type_count']}\n"
+                  f"\n--- Entities ---\n")
         for e in summary["entities"]:
-            print(f"  {e['name']} ({e['entity_kind']}): "
-                  f"{e['properties']} attrs, {e['keys']} keys, "
-                  f"{e['constraints']} constraints, {e['relationships']} rels")
-        print(f"\n--- SMILE Template ---")
-        print(result["smile_template"])
+            buf.write(f"  {e['name']} ({e['entity_kind']}): "
+                      f"{e['properties']} attrs, {e['keys']} keys, "
+                      f"{e['constraints']} constraints, {e['relationships']} rels\n")
+        buf.write(f"\n--- SMILE Template ---\n{result['smile_template']}\n")
+        sys.stdout.write(buf.getvalue())
     else:
         # Full JSON output
         print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -340,21 +340,23 @@ def run_test(direction: str, verbose: bool = False) -> dict:
     }
 
 
+def _attr_label(a: dict) -> str:
+    return a['name'] + ' [PK]' if a.get('is_key') else a['name']
+
+
 def _print_verbose(r: dict):
     """Print detailed schema information (for debugging)."""
-    def filter_entities(d):
-        return {k: v for k, v in d.items() if not k.startswith('__')}
-
-    print("\n         --- Source Schema ---")
-    source_filtered = filter_entities(r.get('source', {}))
-    for name, entity in source_filtered.items():
-        attrs = [a['name'] + (' [PK]' if a.get('is_key') else '') for a in entity.get('properties', [])]
-        print(f"         {name}: {attrs}")
-
-    print("\n         --- Meta V2 (Result) ---")
-    result_filtered = filter_entities(r.get('result', {}))
-    for name, entity in result_filtered.items():
-        attrs = [a['name'] + (' [PK]' if a.get('is_key') else '') for a in entity.get('properties', [])]
+    out = ["\n         --- Source Schema ---"]
+    for name, entity in r.get('source', {}).items():
+        if not name.startswith('__'):
+            attrs = [_attr_label(a) for a in entity.get('properties', [])]
+            out.append(f"         {name}: {attrs}")
+
+    out.append("\n         --- Meta V2 (Result) ---")
+    for name, entity in r.get('result', {}).items():
+        if name.startswith('__'):
+            continue
+        attrs = [_attr_label(a) for a in entity.get('properties', [])]
         embedded = [e['name'] for e in entity.get('embedded', [])]
         refs = [f"{ref['name']}->{ref['target']}" for ref in entity.get('references', [])]
         line = f"         {name}: {attrs}"
@@ -362,23 +364,24 @@ def _print_verbose(r: dict):
             line += f" embedded={embedded}"
         if refs:
             line += f" refs={refs}"
-        print(line)
+        out.append(line)
+    print("\n".join(out))
 
 
 # pytest-compatible test functions
 import pytest
 
-_northwind_same_keys = sorted(
+_northwind_same_keys = tuple(sorted(
     k for k in MIGRATION_CONFIGS
     if k.startswith("northwind_") and
     MIGRATION_CONFIGS[k].source_type == MIGRATION_CONFIGS[k].target_type
-)
+))
 
-_northwind_cross_keys = sorted(
+_northwind_cross_keys = tuple(sorted(
     k for k in MIGRATION_CONFIGS
     if k.startswith("northwind_") and
     MIGRATION_CONFIGS[k].source_type != MIGRATION_CONFIGS[k].target_type
-)
+))
 
 
 @pytest.mark.parametrize("direction", _northwind_same_keys)
@@ -441,13 +444,13 @@ def main():
     print("SMILE FULL FLOW VERIFICATION")
     print("=" * 70)
 
-    same_keys = list(_northwind_same_keys)
-    cross_keys = list(_northwind_cross_keys)
+    same_keys = _northwind_same_keys
+    cross_keys = _northwind_cross_keys
 
     # Apply --only filter
     if args.only:
-        same_keys = [k for k in same_keys if args.only in k]
-        cross_keys = [k for k in cross_keys if args.only in k]
+        same_keys = tuple(k for k in same_keys if args.only in k)
+        cross_keys = tuple(k for k in cross_keys if args.only in k)
 
     all_results = {}
     total_warnings = 0
@@ -0,0 +1,113 @@
+"""Unit tests for MongoDBAdapter export internals.
+
+Small hand-built Database fixtures, no SMILE script or pipeline involved, so
+the export invariants are exercised in isolation.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Schema.adapters.mongodb_adapter import MongoDBAdapter
+from Schema.unified_meta_schema import (
+    Database, DatabaseType, EntityType, EntityKind,
+    Property, PrimitiveDataType, PrimitiveType, Cardinality, Embedded,
+)
+
+
+def _diamond_db() -> Database:
+    """Two roots that both embed the same ``address`` entity."""
+    db = Database(db_name="t", db_type=DatabaseType.DOCUMENT)
+    address = EntityType(object_name=["address"], entity_kind=EntityKind.EMBEDDED, is_root=False)
+    address.add_property(Property("city", PrimitiveDataType(PrimitiveType.STRING, max_length=15),
+                                  is_optional=False))
+    for root_name in ("customers", "suppliers"):
+        root = EntityType(object_name=[root_name], entity_kind=EntityKind.DOCUMENT)
+        root.add_property(Property("_id", PrimitiveDataType(PrimitiveType.OBJECT_ID),
+                                   is_key=True, is_optional=False))
+        root.add_relationship(Embedded(aggr_name="address", aggregates="address",
+                                       target_end_cardinality=Cardinality.ONE_TO_ONE,
+                                       is_optional=False))
+        db.add_entity_type(root)
+    db.add_entity_type(address)
+    return db
+
+
+def test_shared_embedded_subtree_exported_identically_but_not_aliased():
+    """A subtree reached from several parents is rendered once and reused;
+    every parent must still receive an independent dict."""
+    schema = MongoDBAdapter.export_to_json(_diamond_db())
+    collections = schema["collections"]
+    cust_addr = collections["customers"]["properties"]["address"]
+    supp_addr = collections["suppliers"]["properties"]["address"]
+
+    assert cust_addr == supp_addr
+    assert cust_addr["properties"]["city"] == {"bsonType": "string", "maxLength": 15}
+    assert cust_addr is not supp_addr
+    cust_addr["properties"]["city"]["maxLength"] = 99
+    assert supp_addr["properties"]["city"]["maxLength"] == 15
+
+
+def test_embedding_cycle_raises():
+    """R embeds A and A embeds R: the export must fail naming the cycle
+    rather than truncate the nested sub-document."""
+    db = Database(db_name="t", db_type=DatabaseType.DOCUMENT)
+    root = EntityType(object_name=["r"], entity_kind=EntityKind.DOCUMENT)
+    a = EntityType(object_name=["a"], entity_kind=EntityKind.EMBEDDED, is_root=False)
+    for holder, target in ((root, "a"), (a, "r")):
+        holder.add_relationship(Embedded(aggr_name=target, aggregates=target,
+                                         target_end_cardinality=Cardinality.ZERO_TO_ONE))
+    for entity in (root, a):
+        db.add_entity_type(entity)
+
+    with pytest.raises(ValueError, match="Embedding cycle: r -> a -> r"):
+        MongoDBAdapter.export_to_json(db, root_entity_name="r")
+
+
+def test_deeply_nested_embedding_exports_without_recursion():
+    """Nesting deeper than the interpreter recursion limit still exports."""
+    depth = sys.getrecursionlimit() + 200
+    db = Database(db_name="t", db_type=DatabaseType.DOCUMENT)
+    path = ["root"]
+    parent = EntityType(object_name=list(path), entity_kind=EntityKind.DOCUMENT)
+    db.add_entity_type(parent)
+    for _ in range(depth):
+        path.append("child")
+        child = EntityType(object_name=list(path), entity_kind=EntityKind.EMBEDDED, is_root=False)
+        parent.add_relationship(Embedded(aggr_name="child", aggregates=child.full_path,
+                                         target_end_cardinality=Cardinality.ZERO_TO_ONE))
+        db.add_entity_type(child)
+        parent = child
+
+    node = MongoDBAdapter.export_to_json(db, root_entity_name="root")
+    levels = 0
+    while "child" in node["properties"]:
+        node = node["properties"]["child"]
+        levels += 1
+    assert levels == depth
+
+
+def test_child_shared_with_an_ancestor_is_built_before_its_parent():
+    """Root R embeds [A, D] and A also embeds D: D must be exported under A
+    even though R queued it first."""
+    db = Database(db_name="t", db_type=DatabaseType.DOCUMENT)
+    root = EntityType(object_name=["r"], entity_kind=EntityKind.DOCUMENT)
+    root.add_property(Property("_id", PrimitiveDataType(PrimitiveType.OBJECT_ID),
+                               is_key=True, is_optional=False))
+    a = EntityType(object_name=["a"], entity_kind=EntityKind.EMBEDDED, is_root=False)
+    a.add_property(Property("x", PrimitiveDataType(PrimitiveType.STRING)))
+    d = EntityType(object_name=["d"], entity_kind=EntityKind.EMBEDDED, is_root=False)
+    d.add_property(Property("y", PrimitiveDataType(PrimitiveType.STRING)))
+    for holder, target in ((root, "a"), (root, "d"), (a, "d")):
+        holder.add_relationship(Embedded(aggr_name=target, aggregates=target,
+                                         target_end_cardinality=Cardinality.ZERO_TO_ONE))
+    for entity in (root, a, d):
+        db.add_entity_type(entity)
+
+    schema = MongoDBAdapter.export_to_json(db, root_entity_name="r")
+    a_schema = schema["properties"]["a"]
+    assert list(a_schema["properties"]) == ["x", "d"]
+    assert a_schema["properties"]["d"] == schema["properties"]["d"]
+    assert a_schema["properties"]["d"] is not schema["properties"]["d"]
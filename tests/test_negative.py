@@ -250,6 +250,14 @@ class TestAdapterMalformedInput:
         assert isinstance(db, Database)
         assert len(db.entity_types) == 0, "no tables should be parsed from garbage"
 
+    def test_postgresql_dash_dash_inside_block_comment(self):
+        # ``--`` inside ``/* ... */`` must not eat the block's closing ``*/``
+        # (and the CREATE TABLE after it on the same line).
+        from Schema.adapters import PostgreSQLAdapter
+        db = PostgreSQLAdapter().parse(
+            "/* old -- note */ CREATE TABLE t (id INT PRIMARY KEY);", "t")
+        assert list(db.entity_types) == ["t"]
+
     def test_mongodb_rejects_invalid_json(self):
         from Schema.adapters import MongoDBAdapter
         with pytest.raises(Exception):  # json.JSONDecodeError or similar
@@ -5,6 +5,7 @@ Supports both SMILE_Specific (.smile) and SMILE_Generalized (.smile_gen) grammar
 """
 import sys
 import os
+from collections import Counter
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -54,28 +55,29 @@ def parse_smile_file(filepath: str, verbose: bool = True) -> tuple:
         print("\n[SUCCESS] No syntax errors")
 
         if verbose:
-            # Print migration context
-            print("\n--- Migration Context ---")
-            print(f"Name: {context.name}:{context.version}")
-            print(f"Direction: {context.source_db_type} -> {context.target_db_type}")
-
-            # Print operations
-            print(f"\n--- Parsed Operations ({len(operations)} total) ---")
+            # Collected and written with one print per file.
+            out = [
+                "\n--- Migration Context ---",
+                f"Name: {context.name}:{context.version}",
+                f"Direction: {context.source_db_type} -> {context.target_db_type}",
+                f"\n--- Parsed Operations ({len(operations)} total) ---",
+            ]
             for i, op in enumerate(operations, 1):
-                print(f"{i}. {op.op_type}")
+                out.append(f"{i}. {op.op_type}")
                 if op.original_keyword and op.original_keyword != op.op_type:
-                    print(f"   (Original keyword: {op.original_keyword})")
+                    out.append(f"   (Original keyword: {op.original_keyword})")
                 if op.params:
                     import dataclasses as _dc
                     for key, value in _dc.asdict(op.params).items():
                         if isinstance(value, list):
-                            print(f"   - {key}: {value}")
+                            out.append(f"   - {key}: {value}")
                         elif isinstance(value, dict):
-                            print(f"   - {key}:")
+                            out.append(f"   - {key}:")
                             for k, v in value.items():
-                                print(f"     • {k}: {v}")
+                                out.append(f"     • {k}: {v}")
                         else:
-                            print(f"   - {key}: {value}")
+                            out.append(f"   - {key}: {value}")
+            print("\n".join(out))
 
         return True, context, operations, []
 
@@ -88,11 +90,7 @@ def parse_smile_file(filepath: str, verbose: bool = True) -> tuple:
 
 def count_operations(operations: list) -> dict:
     """Count different operation types."""
-    counts = {}
-    for op in operations:
-        op_type = op.op_type
-        counts[op_type] = counts.get(op_type, 0) + 1
-    return counts
+    return dict(Counter(op.op_type for op in operations))
 
 
 # pytest-compatible test functions
@@ -0,0 +1,41 @@
+"""Unit tests for the parse-result cache in ``parse_smile_auto``.
+
+Scripts are written to a temp directory so they can be edited between
+parses without touching the shared fixtures.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parser.factory import parse_smile_auto
+
+_SCRIPT = Path(__file__).parent / "specific" / "northwind_pg1_to_pg2.smile"
+_HEADER = (
+    "EVOLUTION t:1.0\n"
+    "FROM RELATIONAL TO RELATIONAL\n"
+    "USING s VERSION 1 TO 2\n"
+)
+
+
+def test_cached_parse_is_equal_but_not_aliased(tmp_path):
+    path = tmp_path / "m.smile"
+    path.write_bytes(_SCRIPT.read_bytes())
+    context, operations, errors = parse_smile_auto(str(path))
+    operations[0].params = None
+    context.version = "mutated"
+
+    again_context, again_ops, again_errors = parse_smile_auto(str(path))
+    assert again_ops[0].params is not None
+    assert again_context.version != "mutated"
+    assert again_ops is not operations and again_errors == errors
+
+
+def test_edited_script_is_reparsed(tmp_path):
+    path = tmp_path / "m.smile"
+    path.write_text(_HEADER + "DELETE_PROPERTY products.category_id\n", encoding="utf-8")
+    _, before, _ = parse_smile_auto(str(path))
+    path.write_text(_HEADER + "DELETE_PROPERTY products.category_id\n"
+                    "DELETE_PROPERTY categories.category_id\n", encoding="utf-8")
+    _, after, _ = parse_smile_auto(str(path))
+    assert (len(before), len(after)) == (1, 2)
@@ -0,0 +1,73 @@
+"""Unit tests for PostgreSQLAdapter DDL parsing internals.
+
+Inline DDL snippets, no fixture files or pipeline, so the tokenising edge
+cases are exercised in isolation.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Schema.adapters import PostgreSQLAdapter
+
+
+def test_create_table_body_ends_at_matching_paren():
+    """A ``);`` inside a string literal does not end the body, and the
+    statement may put whitespace between ``)`` and ``;``."""
+    ddl = (
+        "CREATE TABLE a (x TEXT CHECK (x IN ('a);b')), y INT) ;\n"
+        "CREATE TABLE b (z INT PRIMARY KEY);\n"
+    )
+    db = PostgreSQLAdapter().parse(ddl, "t")
+    assert list(db.entity_types) == ["a", "b"]
+    assert [p.name for p in db.entity_types["a"].properties] == ["x", "y"]
+
+
+def test_long_foreign_key_chain_sorts_without_recursion():
+    """An FK chain longer than the recursion limit still orders every
+    referenced table before its referrer."""
+    depth = sys.getrecursionlimit() + 200
+    ddl = "".join(
+        f"CREATE TABLE t{i} (id INT PRIMARY KEY, p INT REFERENCES t{i + 1}(id));\n"
+        for i in range(depth)
+    ) + f"CREATE TABLE t{depth} (id INT PRIMARY KEY);\n"
+    db = PostgreSQLAdapter().parse(ddl, "t")
+    order = [e.name for e in PostgreSQLAdapter._sort_entities_by_dependency(db)]
+    assert order == [f"t{i}" for i in range(depth, -1, -1)]
+
+
+def test_export_to_sql_file_matches_export_to_sql(tmp_path):
+    """Streaming the script to disk writes exactly the in-memory export."""
+    ddl = (
+        "CREATE TABLE customers (id SERIAL PRIMARY KEY, name VARCHAR(50));\n"
+        "CREATE TABLE orders (id SERIAL PRIMARY KEY, "
+        "customer_id INT REFERENCES customers(id));\n"
+    )
+    db = PostgreSQLAdapter().parse(ddl, "t")
+    out = tmp_path / "out.sql"
+    PostgreSQLAdapter.export_to_sql_file(db, str(out))
+    assert out.read_text(encoding="utf-8") == PostgreSQLAdapter.export_to_sql(db)
+
+
+def test_bare_name_type_column_matches_full_parse():
+    """The ``name TYPE`` fast path yields what the full column pattern does."""
+    adapter = PostgreSQLAdapter()
+    fast, _, _ = adapter._parse_column("Order_No\n   INTEGER")
+    full, _, _ = adapter._parse_column("Order_No INTEGER NULL")
+    assert (fast.name, fast.data_type, fast.is_key, fast.is_optional) == \
+        (full.name, full.data_type, full.is_key, full.is_optional)
+    assert adapter._parse_column("a-b INTEGER") == (None, None, None)
+
+
+def test_big_int_check_literal_round_trips_through_save_and_load(tmp_path):
+    """Integers wider than 64 bits survive ``save_to_file``/``load_from_file``
+    unchanged, and the saved file is exactly ``to_json()``."""
+    from Schema.unified_meta_schema import Database
+
+    ddl = "CREATE TABLE t (id INT PRIMARY KEY, x NUMERIC CHECK (x < 99999999999999999999));\n"
+    db = PostgreSQLAdapter().parse(ddl, "t")
+    out = tmp_path / "meta.json"
+    db.save_to_file(str(out))
+    assert out.read_text(encoding="utf-8") == db.to_json()
+    assert "99999999999999999999" in out.read_text(encoding="utf-8")
+    assert Database.load_from_file(str(out)).to_dict() == db.to_dict()
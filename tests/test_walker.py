@@ -0,0 +1,89 @@
+"""Unit tests for the selective parse-tree walker.
+
+Every fixture script is walked both by ``parser.walker.walk`` and by ANTLR's
+``ParseTreeWalker``; the listener state (and, for a recording listener, the
+exact hook sequence) must match. Hook names themselves are checked when a
+SMILE listener class is created.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from antlr4 import CommonTokenStream, FileStream, ParseTreeWalker
+
+from parser.factory import detect_grammar_type, get_parser_components
+from parser.listeners import SMILEGeneralizedListener, SMILESpecificListener
+from parser.walker import walk
+
+_TESTS = Path(__file__).parent
+_SCRIPTS = sorted(_TESTS.glob("**/*.smile")) + sorted(_TESTS.glob("**/*.smile_gen"))
+
+
+def _parse(path: Path):
+    grammar = detect_grammar_type(str(path))
+    lexer_cls, parser_cls, base_listener = get_parser_components(grammar)
+    parser = parser_cls(CommonTokenStream(lexer_cls(FileStream(str(path), encoding="utf-8"))))
+    return grammar, base_listener, parser.migration()
+
+
+@pytest.mark.parametrize("path", _SCRIPTS, ids=lambda p: p.name)
+def test_walk_matches_antlr_walker(path):
+    grammar, _, tree = _parse(path)
+    listener_cls = SMILEGeneralizedListener if grammar == "generalized" else SMILESpecificListener
+    ours, antlr = listener_cls(), listener_cls()
+    walk(ours, tree)
+    ParseTreeWalker.DEFAULT.walk(antlr, tree)
+    assert ours.context == antlr.context
+    assert [(o.op_type, o.params) for o in ours.operations] == \
+        [(o.op_type, o.params) for o in antlr.operations]
+
+
+def test_walk_calls_enter_and_exit_hooks_in_antlr_order():
+    _, base_listener, tree = _parse(_SCRIPTS[0])
+
+    class Recorder(base_listener):
+        def __init__(self):
+            self.events = []
+
+        def enterHeader(self, ctx):
+            self.events.append(("enter", ctx))
+
+        def exitHeader(self, ctx):
+            self.events.append(("exit", ctx))
+
+        def exitMigration(self, ctx):
+            self.events.append(("exit", ctx))
+
+    ours, antlr = Recorder(), Recorder()
+    walk(ours, tree)
+    ParseTreeWalker.DEFAULT.walk(antlr, tree)
+    assert ours.events == antlr.events
+    assert [kind for kind, _ in ours.events] == ["enter", "exit", "exit"]
+
+
+def test_walk_reaches_hooks_on_deep_leaf_rules():
+    """Subtree pruning must still enter every rule that can hold a hooked one."""
+    for path in _SCRIPTS:
+        _, base_listener, tree = _parse(path)
+
+        class Leaves(base_listener):
+            def __init__(self):
+                self.texts = []
+
+            def enterIdentifier(self, ctx):
+                self.texts.append(ctx.getText())
+
+        ours, antlr = Leaves(), Leaves()
+        walk(ours, tree)
+        ParseTreeWalker.DEFAULT.walk(antlr, tree)
+        assert ours.texts and ours.texts == antlr.texts, path.name
+
+
+def test_misspelt_listener_hook_is_rejected_at_class_creation():
+    with pytest.raises(TypeError, match="enterAdd_proprety"):
+        class Misspelt(SMILESpecificListener):
+            def enterAdd_proprety(self, ctx):
+                pass
@@ -170,8 +170,9 @@ class SMILEHandler(SimpleHTTPRequestHandler):
                     src_count = len(src_db.entity_types)
 
                     # Parse SMILE script in-memory under requested grammar
-                    from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+                    from antlr4 import InputStream, CommonTokenStream
                     from parser.factory import get_parser_components, SyntaxErrorListener
+                    from parser.walker import walk
                     from parser.listeners import SMILESpecificListener, SMILEGeneralizedListener
                     grammar = 'generalized' if syntax == 'generalized' else 'specific'
                     LexerClass, ParserClass, _ = get_parser_components(grammar)
@@ -206,8 +207,7 @@ class SMILEHandler(SimpleHTTPRequestHandler):
                         }
                     else:
                         listener = ListenerCls()
-                        walker = ParseTreeWalker()
-                        walker.walk(listener, tree)
+                        walk(listener, tree)
                         operations = listener.operations
                         # Apply + export through the SAME helpers run_migration() uses
                         # so the canned-migration path and the user's Run-button path